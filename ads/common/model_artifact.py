@@ -4,29 +4,29 @@
 # Copyright (c) 2020, 2022 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import codecs
+import copy
 import fnmatch
+import functools
 import importlib
 import json
+import locale
 import os
+import platform
 import re
-import git
 import shutil
 import subprocess
 import sys
 import textwrap
 import uuid
-import python_jsonschema_objects as pjs
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from enum import Enum
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
-import ads.dataset.factory as factory
-import fsspec
 import numpy as np
-import oci.data_science
-import oci.exceptions
 import pandas as pd
-import pkg_resources
 import yaml
 
 from ads.common.decorator.runtime_dependency import (
@@ -68,16 +68,47 @@ from ads.config import (
 )
 from ads.feature_engineering.schema import DataSizeTooWide, Schema, SchemaSizeTooLarge
 from ads.model.extractor.model_info_extractor_factory import ModelInfoExtractorFactory
-from git import InvalidGitRepositoryError, Repo
-
-from oci.data_science.models import ModelProvenance
 
 try:
-    from yaml import CDumper as dumper
-    from yaml import CLoader as loader
+    from yaml import CSafeDumper as dumper
+    from yaml import CSafeLoader as loader
 except:
-    from yaml import Dumper as dumper
-    from yaml import Loader as loader
+    from yaml import SafeDumper as dumper
+    from yaml import SafeLoader as loader
+
+    logger.warning(
+        "LibYAML is not available, falling back to the pure Python YAML parser. "
+        "Install PyYAML with LibYAML bindings to speed up the runtime.yaml processing."
+    )
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Set by `pip_install` so that the installed distributions are rescanned
+# the next time the model artifact requirements are checked.
+_PACKAGES_INSTALLED = False
+
+# Set to True to write runtime.yaml with the YAML dumper instead of `_emit_runtime_yaml`.
+_RUNTIME_YAML_USE_DUMPER = False
+
+_OCI_PREFIX_PATTERN = re.compile(r"oci://*@*")
+
+# The characters which are not allowed unescaped in a YAML stream.
+_YAML_NON_PRINTABLE_PATTERN = re.compile(
+    "[^\x09\x0A\x0D\x20-\x7E\x85\xA0-\uD7FF\uE000-\uFFFD\U00010000-\U0010FFFF]"
+)
+
+MANIFEST_PREFETCH_MAX_WORKERS = 16
+DATA_UPLOAD_MAX_WORKERS = 16
+_UPLOAD_CHUNK_SIZE = 8 << 20
+_EXECUTE_READ_SIZE = 1 << 16
+
+# Translation table turning the `<` and `>` version operators of a requirement into `=`.
+_VERSION_OPERATOR_TABLE = str.maketrans("<>", "==")
+
+_PYTHON_VERSION = platform.python_version()
 
 MODEL_ARTIFACT_VERSION = "3.0"
 INPUT_SCHEMA_FILE_NAME = "input_schema.json"
@@ -86,6 +117,37 @@ OUTPUT_SCHEMA_FILE_NAME = "output_schema.json"
 _TRAINING_RESOURCE_OCID = JOB_RUN_OCID or NB_SESSION_OCID
 _COMPARTMENT_OCID = NB_SESSION_COMPARTMENT_OCID or JOB_RUN_COMPARTMENT_OCID
 
+# The model provenance keys mapped to the environment variables they are read from
+# and the default values used when the variables are not set.
+_ENVIRONMENT_DETAILS_VARIABLES = {
+    "TRAINING_REGION": ("NB_REGION", "NOT_FOUND"),
+    "TRAINING_COMPARTMENT_OCID": ("NB_SESSION_COMPARTMENT_OCID", "NOT_FOUND"),
+    "TRAINING_RESOURCE_OCID": ("NB_SESSION_OCID", "NOT_FOUND"),
+    "PROJECT_OCID": ("PROJECT_OCID", "NOT_FOUND"),
+    "TENANCY_OCID": ("TENANCY_OCID", "NOT_FOUND"),
+    "USER_OCID": ("USER_OCID", "NOT_FOUND"),
+    "VM_IMAGE_INTERNAL_ID": ("VM_ID", "VMIDNOTSET"),
+}
+_ENVIRONMENT_DETAILS = {}
+
+
+def _refresh_environment_details() -> None:
+    """Takes a snapshot of the environment variables used in the model provenance.
+
+    The snapshot is taken once at import. Call this function to pick up
+    the changes made to the environment variables afterwards.
+    """
+    _ENVIRONMENT_DETAILS.clear()
+    _ENVIRONMENT_DETAILS.update(
+        {
+            key: os.environ.get(env_var, default)
+            for key, (env_var, default) in _ENVIRONMENT_DETAILS_VARIABLES.items()
+        }
+    )
+
+
+_refresh_environment_details()
+
 
 class InvalidDataType(Exception):
     """Invalid Data Type."""
@@ -103,6 +165,306 @@ MODEL_DEPLOYMENT:
         INFERENCE_PYTHON_VERSION: <python version>
 """
 
+_SAMPLE_RUNTIME_TEMPLATE = yaml.load(SAMPLE_RUNTIME_YAML, Loader=loader)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_runtime_schema() -> dict:
+    """Loads the runtime.yaml JSON schema shipped with ADS.
+
+    The schema is read only once per process.
+    """
+    schema = None
+    with open(
+        os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "model_artifact_schema.json"
+        ),
+        "rb",
+    ) as schema_file:
+        schema = _json_loads(schema_file.read())
+
+    if not schema:
+        raise Exception("Cannot load schema file to generate the runtime.yaml file.")
+    return schema
+
+
+@functools.lru_cache(maxsize=1)
+def _get_runtime_validator():
+    """Builds the validator of the runtime.yaml content.
+
+    The schema is checked and the validator is built only once per process.
+    """
+    import jsonschema
+
+    schema = _load_runtime_schema()
+    validator_cls = jsonschema.validators.validator_for(schema)
+    validator_cls.check_schema(schema)
+    return validator_cls(schema)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_runtime_ns():
+    """Builds the runtime.yaml classes from the JSON schema.
+
+    Building the classes is expensive, so the namespace is built only once per process
+    and shared across the `ModelArtifact` instances.
+    """
+    import python_jsonschema_objects as pjs
+
+    return pjs.ObjectBuilder(_load_runtime_schema()).build_classes()
+
+
+@functools.lru_cache(maxsize=32)
+def _load_runtime_yaml(path: str, mtime: int, size: int) -> dict:
+    """Parses the runtime yaml file.
+
+    The `mtime` and `size` are only used as a part of the cache key, so that the file
+    is parsed again once it is modified. The size catches the files rewritten within
+    the timestamp resolution of the filesystem.
+    """
+    with open(path, encoding="utf-8") as runtime_file:
+        return yaml.load(runtime_file, Loader=loader)
+
+
+def _read_runtime_yaml(path: str) -> dict:
+    """Reads the runtime yaml file, reusing the parsed content while the file is unchanged."""
+    stat = os.stat(path)
+    return _load_runtime_yaml(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_user_conda_config() -> Optional[dict]:
+    """Loads the conda config created by `odsc init` from `~/conda/config.yaml`.
+
+    The config is read only once per process. Call `_load_user_conda_config.cache_clear()`
+    to pick up the changes made to the file afterwards.
+
+    Returns
+    -------
+    Optional[dict]
+        The content of the config file or None if the file does not exist.
+    """
+    try:
+        with open(
+            os.path.join(os.path.expanduser("~"), "conda", "config.yaml")
+        ) as conf:
+            return yaml.load(conf, Loader=loader)
+    except FileNotFoundError:
+        return None
+
+
+def _git(args: List[str], cwd: str = None) -> Optional[str]:
+    """Runs a git command and returns its stripped output.
+
+    Parameters
+    ----------
+    args: List[str]
+        The git command arguments, e.g. `["rev-parse", "HEAD"]`.
+    cwd: (str, optional). Defaults to None.
+        The directory to run the command in. Defaults to the current working directory.
+
+    Returns
+    -------
+    Optional[str]
+        The output of the command or None if the command failed.
+    """
+    try:
+        result = subprocess.run(
+            ["git"] + args,
+            cwd=cwd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=False,
+        )
+    except OSError:
+        # git executable is not available
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def _iter_artifact_files(artifact_dir: str, remove_pycache: bool = False):
+    """Iterates over the files and folders of the artifact directory which are
+    not ignored by the `.model-ignore` file.
+
+    Parameters
+    ----------
+    artifact_dir: str
+        The model artifact directory.
+    remove_pycache: (bool, optional). Defaults to False.
+        Whether to remove the `__pycache__` folders met during the walk.
+
+    Yields
+    ------
+    Tuple[str, os.DirEntry]
+        The path relative to the artifact directory and its directory entry.
+        Use `entry.stat()` to get the size or the modification time of the file
+        without an additional system call on repeated access.
+    """
+    if os.path.exists(os.path.join(artifact_dir, ".model-ignore")):
+        ignore_patterns = (
+            Path(os.path.join(artifact_dir), ".model-ignore").read_text().splitlines()
+        )
+    else:
+        ignore_patterns = []
+    translated_patterns = []
+    translated_dir_patterns = []
+    for ignore in ignore_patterns:
+        if not ignore.startswith("#") and ignore.strip() != "":
+            if ignore.endswith("/"):
+                ignore = ignore[:-1] + "*"
+                translated_dir_patterns.append(
+                    fnmatch.translate("/%s" % ignore.strip())
+                )
+            translated_patterns.append(fnmatch.translate("/%s" % ignore.strip()))
+    # all the patterns are matched at once with a single alternation
+    ignore_regex = (
+        re.compile("|".join(translated_patterns)) if translated_patterns else None
+    )
+    # a `dir/` pattern matches everything inside the folder, so the folder is
+    # not walked at all. The other patterns are matched against each path, e.g.
+    # `data` ignores the `data` folder itself, but not the files inside it.
+    prune_regex = (
+        re.compile("|".join(translated_dir_patterns))
+        if translated_dir_patterns
+        else None
+    )
+
+    def is_ignored(path, regex=ignore_regex):
+        return regex is not None and regex.search(path) is not None
+
+    prefix_len = len(artifact_dir) + 1
+
+    def walk(top):
+        # mirrors os.walk, but keeps the directory entries, which cache the file
+        # type and, once fetched, the stat information of the files
+        files, dirs = [], []
+        try:
+            with os.scandir(top) as entries:
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    (dirs if is_dir else files).append(entry)
+        except OSError:
+            return
+        if remove_pycache:
+            for entry in dirs:
+                if entry.name == "__pycache__":
+                    shutil.rmtree(entry.path, ignore_errors=True)
+            dirs = [entry for entry in dirs if entry.name != "__pycache__"]
+        dirs = [entry for entry in dirs if not is_ignored(entry.path, prune_regex)]
+        for entry in files:
+            if not is_ignored(entry.path):
+                yield entry.path[prefix_len:], entry
+        for entry in dirs:
+            if not is_ignored(entry.path):
+                yield entry.path[prefix_len:], entry
+        for entry in dirs:
+            if not entry.is_symlink():
+                yield from walk(entry.path)
+
+    yield from walk(artifact_dir)
+
+
+def _shorten_join(
+    items: List[str], width: int = 255, sep: str = ", ", placeholder: str = "..."
+) -> str:
+    """Joins the items and shortens the result to fit in the given width.
+
+    The result is the same as `textwrap.shorten(sep.join(items), width, placeholder=placeholder)`,
+    but only the leading items that can appear in the shortened text are joined.
+
+    Parameters
+    ----------
+    items: List[str]
+        The items to join.
+    width: (int, optional). Defaults to 255.
+        The maximum length of the result.
+    sep: (str, optional). Defaults to ", ".
+        The separator of the items.
+    placeholder: (str, optional). Defaults to "...".
+        The text appended to the result when it is shortened.
+
+    Returns
+    -------
+    str
+        The shortened text.
+    """
+    joined = []
+    length = 0
+    for item in items:
+        joined.append(item)
+        length += len(item) + len(sep)
+        # once the text, with the whitespaces collapsed, is longer than the width,
+        # the remaining items cannot appear in the shortened text
+        if length > width and len(" ".join(sep.join(joined).split())) > width:
+            break
+    return textwrap.shorten(sep.join(joined), width, placeholder=placeholder)
+
+
+@functools.lru_cache(maxsize=64)
+def _fetch_conda_manifest(uri: str) -> dict:
+    """Fetches the manifest metadata of the conda pack stored in Object Storage.
+
+    The manifest is cached by the conda pack URI, so that the Object Storage is
+    queried only once per conda pack within a process.
+
+    Parameters
+    ----------
+    uri: str
+        The Object Storage URI of the conda pack.
+        `oci://<bucket-name>@<namespace>/<prefix>/<env>.tar.gz`
+
+    Returns
+    -------
+    dict
+        The manifest metadata of the conda pack.
+    """
+    return ObjectStorageDetails.from_path(env_path=uri).fetch_metadata_of_object()
+
+
+def _escape_yaml_character(match) -> str:
+    """Escapes the matched character in a YAML double-quoted scalar."""
+    return "\\u%04x" % ord(match.group())
+
+
+def _emit_runtime_yaml(content: dict, stream, indent: int = 0) -> None:
+    """Writes the runtime.yaml content to the stream.
+
+    The runtime.yaml has a small fixed structure of nested mappings with string
+    values, so it is written directly instead of going through the YAML emitter.
+    The keys are sorted the same way `yaml.dump` sorts them and the values are
+    written as double-quoted scalars, which are valid JSON and YAML strings.
+    The non-ASCII characters are written as is, escaping them the JSON way would
+    split the characters outside of the BMP into surrogate pairs, which YAML
+    does not decode.
+
+    Parameters
+    ----------
+    content: dict
+        The runtime.yaml content.
+    stream:
+        The text stream to write to.
+    indent: (int, optional). Defaults to 0.
+        The indentation of the mapping.
+    """
+    prefix = " " * indent
+    for key in sorted(content):
+        value = content[key]
+        if isinstance(value, dict) and value:
+            stream.write(f"{prefix}{key}:\n")
+            _emit_runtime_yaml(value, stream, indent + 2)
+        else:
+            # an empty mapping is written as `{}`
+            scalar = _YAML_NON_PRINTABLE_PATTERN.sub(
+                _escape_yaml_character, json.dumps(value, ensure_ascii=False)
+            )
+            stream.write(f"{prefix}{key}: {scalar}\n")
+
 
 class ConflictStrategy(object):
     IGNORE = "IGNORE"
@@ -168,6 +530,8 @@ class ModelArtifact(Introspectable):
         -------
         reload(self, model_file_name=None)
             Reload the files in the model artifact directory.
+        prefetch_manifests(uris)
+            Fetches the manifests of the conda packs stored in Object Storage in parallel.
         verify(self, input_data)
             Verifies a model artifact directory.
         install_requirements(self, conflict_strategy=ConflictStrategy.IGNORE)
@@ -244,31 +608,38 @@ class ModelArtifact(Introspectable):
         return getattr(self.score, item)
 
     def __fetch_repo_details(self, training_code_info):
-        repo = git.Repo(".", search_parent_directories=True)
+        repo_dir = _git(["rev-parse", "--show-toplevel"])
+        if repo_dir is None:
+            # not a git repository
+            return None, training_code_info
         # get repository url
-        if len(repo.remotes) > 0:
-            repository_url = (
-                repo.remotes.origin.url
-                if repo.remotes.origin in repo.remotes
-                else list(repo.remotes.values())[0].url
+        remotes = (_git(["remote"], cwd=repo_dir) or "").split()
+        if len(remotes) > 0:
+            repository_url = _git(
+                ["remote", "get-url", "origin" if "origin" in remotes else remotes[0]],
+                cwd=repo_dir,
             )
         else:
-            repository_url = "file://" + repo.working_dir  # no remote repo
+            repository_url = "file://" + repo_dir  # no remote repo
 
         # get git branch
-        git_branch = format(repo.active_branch)
+        # symbolic-ref also resolves the branch of a repository without any commit,
+        # rev-parse covers a detached HEAD
+        git_branch = (
+            _git(["symbolic-ref", "--short", "HEAD"], cwd=repo_dir)
+            or _git(["rev-parse", "--abbrev-ref", "HEAD"], cwd=repo_dir)
+            or "HEAD"
+        )
         # get git commit
-        try:
-            git_commit = format(str(repo.head.commit.hexsha))
-            training_code_info.GIT_COMMIT = git_commit
-        except ValueError:
-            # do not set commit if there isn't any
-            pass
+        git_commit = _git(["rev-parse", "HEAD"], cwd=repo_dir)
+        # do not set commit if there isn't any
+        if git_commit:
+            training_code_info["GIT_COMMIT"] = git_commit
 
-        training_code_info.GIT_REMOTE = repository_url
-        training_code_info.GIT_BRANCH = git_branch
-        training_code_info.ARTIFACT_DIRECTORY = self.artifact_dir
-        return repo, training_code_info
+        training_code_info["GIT_REMOTE"] = repository_url
+        training_code_info["GIT_BRANCH"] = git_branch
+        training_code_info["ARTIFACT_DIRECTORY"] = self.artifact_dir
+        return repo_dir, training_code_info
 
     def __fetch_training_env_details(self, training_info):
         conda_prefix = os.environ.get("CONDA_PREFIX", None)
@@ -280,13 +651,8 @@ class ModelArtifact(Introspectable):
             slug = manifest["slug"] if "slug" in manifest else ""
 
             if manifest_type == PACK_TYPE.USER_CUSTOM_PACK.value:
-                if os.path.exists(
-                    os.path.join(os.path.expanduser("~"), "conda", "config.yaml")
-                ):
-                    with open(
-                        (os.path.join(os.path.expanduser("~"), "conda", "config.yaml"))
-                    ) as conf:
-                        user_config = yaml.load(conf, Loader=yaml.FullLoader)
+                user_config = _load_user_conda_config()
+                if user_config is not None:
                     pack_bucket = user_config["bucket_info"]["name"]
                     pack_namespace = user_config["bucket_info"]["namespace"]
                 else:
@@ -334,48 +700,23 @@ class ModelArtifact(Introspectable):
                     )
         except Exception as e:
             raise e
-        training_info.TRAINING_ENV_SLUG = slug
+        training_info["TRAINING_ENV_SLUG"] = slug
         if manifest_type.lower() in [
             PACK_TYPE.USER_CUSTOM_PACK.value,
             PACK_TYPE.SERVICE_PACK.value,
         ]:
-            training_info.TRAINING_ENV_TYPE = manifest_type
+            training_info["TRAINING_ENV_TYPE"] = manifest_type
         if pack_name:
-            training_info.TRAINING_ENV_PATH = pack_name
-        training_info.TRAINING_PYTHON_VERSION = sys.version.split("|")[0].strip()
+            training_info["TRAINING_ENV_PATH"] = pack_name
+        training_info["TRAINING_PYTHON_VERSION"] = _PYTHON_VERSION
         return training_info
 
     def __environment_details(self, model_provenance):
-        model_provenance.TRAINING_REGION = os.environ.get("NB_REGION", "NOT_FOUND")
-        model_provenance.TRAINING_COMPARTMENT_OCID = os.environ.get(
-            "NB_SESSION_COMPARTMENT_OCID", "NOT_FOUND"
-        )
-        model_provenance.TRAINING_RESOURCE_OCID = os.environ.get(
-            "NB_SESSION_OCID", "NOT_FOUND"
-        )
-        model_provenance.PROJECT_OCID = os.environ.get("PROJECT_OCID", "NOT_FOUND")
-        model_provenance.TENANCY_OCID = os.environ.get("TENANCY_OCID", "NOT_FOUND")
-        model_provenance.USER_OCID = os.environ.get("USER_OCID", "NOT_FOUND")
-        model_provenance.VM_IMAGE_INTERNAL_ID = os.environ.get("VM_ID", "VMIDNOTSET")
+        model_provenance.update(_ENVIRONMENT_DETAILS)
         return model_provenance
 
     def __fetch_runtime_schema__(self):
-        schema = None
-        with open(
-            os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "model_artifact_schema.json"
-            )
-        ) as schema_file:
-            schema = json.load(schema_file)
-
-        if not schema:
-            raise Exception(
-                "Cannot load schema file to generate the runtime.yaml file."
-            )
-
-        builder = pjs.ObjectBuilder(schema)
-        ns = builder.build_classes()
-        return ns
+        return _get_runtime_ns()
 
     def _generate_empty_runtime_yaml(
         self,
@@ -390,7 +731,7 @@ class ModelArtifact(Introspectable):
             "Generating runtime.yaml template. This file needs to be updated "
             "before saving it to the model catalog."
         )
-        content = yaml.load(SAMPLE_RUNTIME_YAML, Loader=yaml.FullLoader)
+        content = copy.deepcopy(_SAMPLE_RUNTIME_TEMPLATE)
         print(
             f"The inference conda environment is {inference_conda_env} and the Python version is {inference_python_version}."
         )
@@ -416,54 +757,54 @@ class ModelArtifact(Introspectable):
         )
 
         with open(os.path.join(self.artifact_dir, "runtime.yaml"), "w") as outfile:
-            yaml.dump(content, outfile)
+            yaml.dump(content, outfile, Dumper=dumper)
 
     def _generate_runtime_yaml(self, model_file_name="model.onnx"):
         if self.progress:
             self.progress.update("Creating runtime.yaml configuration.")
 
-        ns = self.__fetch_runtime_schema__()
-        training_env_info = self.__fetch_training_env_details(ns.TrainingCondaEnv())
-        model_provenance = self.__environment_details(ns.ModelProvenance())
-        model_provenance.TRAINING_CONDA_ENV = training_env_info
-        try:
-            _, training_code_info = self.__fetch_repo_details(ns.TrainingCodeInfo())
-            model_provenance.TRAINING_CODE = training_code_info
-        except git.InvalidGitRepositoryError:
-            pass
+        training_env_info = self.__fetch_training_env_details({})
+        model_provenance = self.__environment_details({})
+        model_provenance["TRAINING_CONDA_ENV"] = training_env_info
+        repo_dir, training_code_info = self.__fetch_repo_details({})
+        if repo_dir is not None:
+            model_provenance["TRAINING_CODE"] = training_code_info
 
-        if not training_env_info.TRAINING_ENV_PATH:
+        if not training_env_info.get("TRAINING_ENV_PATH"):
             logger.warning(
                 "You did not publish the conda environment in which the madel was trained. Publishing the "
                 "conda environment ensures that the exact training environment can be re-used later."
             )
-        inference_info = ns.InferenceCondaEnv()
+        inference_info = {}
         if not self.inference_conda_env:
             message = "By default, the inference conda environment is the same as the training conda environment. Use the `inference_conda_env` parameter to override."
-            if (
-                training_env_info.TRAINING_ENV_TYPE
-                and training_env_info.TRAINING_ENV_PATH
+            if training_env_info.get("TRAINING_ENV_TYPE") and training_env_info.get(
+                "TRAINING_ENV_PATH"
             ):
                 logger.info(message)
-                inference_info.INFERENCE_ENV_SLUG = training_env_info.TRAINING_ENV_SLUG
-                inference_info.INFERENCE_ENV_TYPE = training_env_info.TRAINING_ENV_TYPE
-                inference_info.INFERENCE_ENV_PATH = training_env_info.TRAINING_ENV_PATH
-                inference_info.INFERENCE_PYTHON_VERSION = (
-                    training_env_info.TRAINING_PYTHON_VERSION
-                )
-                self.conda_env = str(training_env_info.TRAINING_ENV_SLUG)
+                inference_info["INFERENCE_ENV_SLUG"] = training_env_info[
+                    "TRAINING_ENV_SLUG"
+                ]
+                inference_info["INFERENCE_ENV_TYPE"] = training_env_info[
+                    "TRAINING_ENV_TYPE"
+                ]
+                inference_info["INFERENCE_ENV_PATH"] = training_env_info[
+                    "TRAINING_ENV_PATH"
+                ]
+                inference_info["INFERENCE_PYTHON_VERSION"] = training_env_info[
+                    "TRAINING_PYTHON_VERSION"
+                ]
+                self.conda_env = str(training_env_info["TRAINING_ENV_SLUG"])
         else:
             self.conda_env = os.path.basename(str(self.inference_conda_env))
             if self.inference_conda_env.startswith("oci://"):
-                inference_info.INFERENCE_ENV_PATH = self.inference_conda_env
+                inference_info["INFERENCE_ENV_PATH"] = self.inference_conda_env
                 try:
-                    metadata_json = ObjectStorageDetails.from_path(
-                        env_path=self.inference_conda_env
-                    ).fetch_metadata_of_object()
-                    inference_info.INFERENCE_PYTHON_VERSION = metadata_json["python"]
+                    metadata_json = _fetch_conda_manifest(self.inference_conda_env)
+                    inference_info["INFERENCE_PYTHON_VERSION"] = metadata_json["python"]
                 except:
                     if not self.inference_python_version:
-                        if not training_env_info.TRAINING_PYTHON_VERSION:
+                        if not training_env_info.get("TRAINING_PYTHON_VERSION"):
                             raise Exception(
                                 "The Python version was not specified."
                                 "Pass in the Python version when preparing a model."
@@ -473,28 +814,28 @@ class ModelArtifact(Introspectable):
                                 "The Python version could not be inferred from the conda environment. Defaulting to the Python "
                                 "version that was used in training."
                             )
-                            inference_info.INFERENCE_PYTHON_VERSION = (
-                                training_env_info.TRAINING_PYTHON_VERSION
-                            )
+                            inference_info[
+                                "INFERENCE_PYTHON_VERSION"
+                            ] = training_env_info["TRAINING_PYTHON_VERSION"]
                     else:
-                        inference_info.INFERENCE_PYTHON_VERSION = (
-                            self.inference_python_version
-                        )
+                        inference_info[
+                            "INFERENCE_PYTHON_VERSION"
+                        ] = self.inference_python_version
             else:
                 pass
         model_deployment_info = None
-        if inference_info.INFERENCE_ENV_PATH:
-            model_deployment_info = ns.ModelDeployment()
-            model_deployment_info.INFERENCE_CONDA_ENV = inference_info
+        if inference_info.get("INFERENCE_ENV_PATH"):
+            model_deployment_info = {"INFERENCE_CONDA_ENV": inference_info}
 
         if (
             not self.inference_conda_env
             and not self.data_science_env
-            and inference_info.INFERENCE_ENV_TYPE == PACK_TYPE.SERVICE_PACK.value
-            and training_env_info.TRAINING_ENV_PATH == inference_info.INFERENCE_ENV_PATH
+            and inference_info.get("INFERENCE_ENV_TYPE") == PACK_TYPE.SERVICE_PACK.value
+            and training_env_info.get("TRAINING_ENV_PATH")
+            == inference_info.get("INFERENCE_ENV_PATH")
         ):
             error_message = (
-                f"The inference conda environment {training_env_info.TRAINING_ENV_SLUG} may have changed. "
+                f"The inference conda environment {training_env_info.get('TRAINING_ENV_SLUG')} may have changed. "
                 + "Publish the current conda environment or set the parameter `data_science_env` to `True` "
                 + "in the `.prepare()` method."
             )
@@ -503,7 +844,10 @@ class ModelArtifact(Introspectable):
             else:
                 logger.warning(error_message)
 
-        if not inference_info.INFERENCE_ENV_PATH and not self.inference_conda_env:
+        if (
+            not inference_info.get("INFERENCE_ENV_PATH")
+            and not self.inference_conda_env
+        ):
             error_message = (
                 f"The inference conda environment is missing. Set the `inference_conda_env` parameter "
                 + "or publish the conda environment and run the `.prepare()` method."
@@ -513,21 +857,28 @@ class ModelArtifact(Introspectable):
             else:
                 logger.warn(error_message)
 
+        self._runtime_info = {
+            "MODEL_ARTIFACT_VERSION": MODEL_ARTIFACT_VERSION,
+            "MODEL_PROVENANCE": model_provenance,
+        }
         if model_deployment_info:
-            self._runtime_info = ns.ModelArtifactSchema(
-                MODEL_ARTIFACT_VERSION=MODEL_ARTIFACT_VERSION,
-                MODEL_PROVENANCE=model_provenance,
-                MODEL_DEPLOYMENT=model_deployment_info,
-            )
-        else:
-            self._runtime_info = ns.ModelArtifactSchema(
-                MODEL_ARTIFACT_VERSION=MODEL_ARTIFACT_VERSION,
-                MODEL_PROVENANCE=model_provenance,
-            )
+            self._runtime_info["MODEL_DEPLOYMENT"] = model_deployment_info
+        _get_runtime_validator().validate(self._runtime_info)
 
-        with open(os.path.join(self.artifact_dir, "runtime.yaml"), "w") as outfile:
+        with open(
+            os.path.join(self.artifact_dir, "runtime.yaml"), "w", encoding="utf-8"
+        ) as outfile:
             outfile.write("# Model runtime environment\n")
-            yaml.dump(self._runtime_info.as_dict(), outfile, default_flow_style=False)
+            if _RUNTIME_YAML_USE_DUMPER:
+                yaml.dump(
+                    self._runtime_info,
+                    outfile,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            else:
+                _emit_runtime_yaml(self._runtime_info, outfile)
 
     def reload(self, model_file_name: str = None):
         """
@@ -542,15 +893,25 @@ class ModelArtifact(Introspectable):
             "score%s" % uuid.uuid4(), os.path.join(self.artifact_dir, "score.py")
         )
         score = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(score)
+        # do not create __pycache__ in the artifact directory
+        dont_write_bytecode = sys.dont_write_bytecode
+        sys.dont_write_bytecode = True
+        try:
+            spec.loader.exec_module(score)
+        finally:
+            sys.dont_write_bytecode = dont_write_bytecode
         self.score = score
-        if os.path.exists(os.path.join(self.artifact_dir, "runtime.yaml")):
+        # a single directory listing instead of probing each file separately
+        with os.scandir(self.artifact_dir) as entries:
+            artifact_files = {entry.name for entry in entries}
+        if "runtime.yaml" in artifact_files:
             if model_file_name:
                 self.model = self.score.load_model(model_file_name)
             else:
                 self.model = self.score.load_model()
-            with open(os.path.join(self.artifact_dir, "runtime.yaml")) as runtime_file:
-                runtime = yaml.load(runtime_file, Loader=yaml.FullLoader)
+            runtime = _read_runtime_yaml(
+                os.path.join(self.artifact_dir, "runtime.yaml")
+            )
             self.version = runtime["MODEL_ARTIFACT_VERSION"]
             try:
                 self.VM_ID = runtime["MODEL_PROVENANCE"]["VM_IMAGE_INTERNAL_ID"]
@@ -562,12 +923,11 @@ class ModelArtifact(Introspectable):
                 ]
             except KeyError:
                 self.conda_env = None
-        elif os.path.exists(os.path.join(self.artifact_dir, "ds-runtime.yaml")):
+        elif "ds-runtime.yaml" in artifact_files:
             self.model = self.score.load_model()
-            with open(
+            runtime = _read_runtime_yaml(
                 os.path.join(self.artifact_dir, "ds-runtime.yaml")
-            ) as runtime_file:
-                runtime = yaml.load(runtime_file, Loader=yaml.FullLoader)
+            )
             self.version = "1.0"
             self.VM_ID = None  # get ads/mlx version?
             self.conda_env = runtime["conda-env"]
@@ -577,11 +937,6 @@ class ModelArtifact(Introspectable):
             self.VM_ID = "UNKNOWN"
             self.conda_env = "base"
             # raise FileNotFoundError(os.path.join(self.artifact_dir, 'runtime.yaml'))
-        # __pycache__ was created during model_artifact.reload() above
-        if os.path.exists(os.path.join(self.artifact_dir, "__pycache__")):
-            shutil.rmtree(
-                os.path.join(self.artifact_dir, "__pycache__"), ignore_errors=True
-            )
         # extract model serialization format as part of custom metadata
         if model_file_name:
             self._serialization_format = self._extract_model_serialization_format(
@@ -602,6 +957,45 @@ class ModelArtifact(Introspectable):
                     category=MetadataCustomCategory.TRAINING_PROFILE,
                 )
 
+    @staticmethod
+    def prefetch_manifests(uris: List[str]) -> Dict[str, Dict]:
+        """Fetches the manifests of the conda packs stored in Object Storage.
+        The ThreadPoolExecutor is used to fetch the manifests in parallel threads.
+
+        The fetched manifests are cached, so preparing the model artifacts that use
+        these conda packs as the inference environment does not query the Object
+        Storage again.
+
+        Parameters
+        ----------
+        uris: List[str]
+            The Object Storage URIs of the conda packs.
+            `oci://<bucket-name>@<namespace>/<prefix>/<env>.tar.gz`
+
+        Returns
+        -------
+        Dict[str, Dict]
+            The map between the conda pack URI and its manifest.
+            The conda packs which manifests could not be fetched are not included.
+        """
+        result = {}
+        uris = [uri for uri in set(uris or []) if uri.startswith("oci://")]
+        if not uris:
+            return result
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(uris), MANIFEST_PREFETCH_MAX_WORKERS)
+        ) as pool:
+            futures = {pool.submit(_fetch_conda_manifest, uri): uri for uri in uris}
+            for task in as_completed(futures):
+                try:
+                    result[futures[task]] = task.result()
+                except Exception as ex:
+                    logger.debug(
+                        f"Failed to fetch the manifest of the `{futures[task]}`: {ex}"
+                    )
+        return result
+
     @staticmethod
     def _extract_model_serialization_format(model_file_name):
         return os.path.splitext(model_file_name)[1][1:]
@@ -612,8 +1006,8 @@ class ModelArtifact(Introspectable):
 
         Parameters
         ----------
-        input_data : str, dict, BytesIO stream
-            Data to be passed into the deployed model. It can be of type json (str), a dict object, or a BytesIO stream.
+        input_data : str, dict, bytes, BytesIO stream
+            Data to be passed into the deployed model. It can be of type json (str), a dict object, bytes or a BytesIO stream.
             All types get converted into a UTF-8 encoded BytesIO stream and is then sent to the handler.
             Any data handling past there is done in func.py. By default it looks for data
             under the keyword "input", and returns data under teh keyword "prediction".
@@ -636,21 +1030,25 @@ class ModelArtifact(Introspectable):
                 return
 
         ctx = FakeCtx()
-        from io import BytesIO
 
-        if type(input_data) == str:
+        if isinstance(input_data, str):
             data = BytesIO(input_data.encode("UTF-8"))
             data_type = "json"
-        elif type(input_data) == dict:
-            from json import dumps
-
-            data = BytesIO(dumps(input_data).encode("UTF-8"))
+        elif isinstance(input_data, dict):
+            data = BytesIO(json.dumps(input_data).encode("UTF-8"))
             data_type = "dict"
-        elif isinstance(type(input_data), type(BytesIO)):
+        elif isinstance(input_data, (bytes, bytearray)):
+            data = BytesIO(input_data)
+            data_type = "BytesIO"
+        elif hasattr(input_data, "read"):
+            # BytesIO or any other binary stream
             data = input_data
             data_type = "BytesIO"
         else:
-            raise TypeError
+            raise TypeError(
+                f"The `{type(input_data)}` input data type is not supported. "
+                "Use a json string, a dict or a BytesIO stream."
+            )
 
         sys_path = sys.path.copy()
         try:
@@ -668,13 +1066,9 @@ class ModelArtifact(Introspectable):
 
         if data_type == "json":
             return output_json
-        output_bstream = BytesIO(resp.body().encode("UTF-8"))
         if data_type == "BytesIO":
-            return output_bstream
-        else:
-            from json import load
-
-            return load(output_bstream)
+            return BytesIO(output_json.encode("UTF-8"))
+        return json.loads(output_json)
 
     def save(
         self,
@@ -777,19 +1171,26 @@ class ModelArtifact(Introspectable):
 
         runtime_yaml_file = os.path.join(self.artifact_dir, "runtime.yaml")
         if os.path.exists(runtime_yaml_file):
-            with open(runtime_yaml_file, "r") as mfile:
-                runtime_prep_info = yaml.load(mfile, Loader=yaml.FullLoader)
+            with open(runtime_yaml_file, "r", encoding="utf-8") as mfile:
+                runtime_prep_info = yaml.load(mfile, Loader=loader)
                 # runtime_info['pack-info'] = deployment_pack_info
         else:
             runtime_prep_info = {}
         ns = self.__fetch_runtime_schema__()
-        runtime_info = ns.ModelArtifactSchema().from_json(json.dumps(runtime_prep_info))
+        # the classes built from the schema accept the loaded mapping as is,
+        # there is no need for a JSON round trip through `from_json`. Unlike
+        # `from_json`, the constructor does not validate the whole object.
+        runtime_info = ns.ModelArtifactSchema(**runtime_prep_info)
+        runtime_info.validate()
 
         training_code_info = self._training_code_info(
             ns, training_script_path, ignore_pending_changes
         )
         if not training_id:
             training_id = _TRAINING_RESOURCE_OCID
+        from oci.data_science.models import ModelProvenance
+        from oci.exceptions import RequestException
+
         model_provenance_metadata = ModelProvenance(
             repository_url=str(training_code_info.GIT_REMOTE),
             git_branch=str(training_code_info.GIT_BRANCH),
@@ -810,19 +1211,9 @@ class ModelArtifact(Introspectable):
         if not compartment_id and not NB_SESSION_COMPARTMENT_OCID:
             raise ValueError("The `compartment_id` must be provided.")
 
-        if os.path.exists(os.path.join(self.artifact_dir, "__pycache__")):
-            shutil.rmtree(
-                os.path.join(self.artifact_dir, "__pycache__"), ignore_errors=True
-            )
+        # the listing also removes the __pycache__ folders from the artifact
         self.metadata_custom._add(
-            ModelCustomMetadataItem(
-                key=MetadataCustomKeys.MODEL_ARTIFACTS,
-                value=textwrap.shorten(
-                    ", ".join(self._get_files()), 255, placeholder="..."
-                ),
-                description="The list of files located in artifacts folder.",
-                category=MetadataCustomCategory.TRAINING_ENV,
-            ),
+            self._model_artifacts_metadata_item(self._get_files(remove_pycache=True)),
             replace=True,
         )
 
@@ -842,8 +1233,17 @@ class ModelArtifact(Introspectable):
         self._validate_metadata()
         self._validate_schema()
 
-        with open(runtime_yaml_file, "w") as mfile:
-            yaml.dump(runtime_info.as_dict(), mfile, Dumper=dumper)
+        with open(runtime_yaml_file, "w", encoding="utf-8") as mfile:
+            if _RUNTIME_YAML_USE_DUMPER:
+                yaml.dump(
+                    runtime_info.as_dict(),
+                    mfile,
+                    Dumper=dumper,
+                    default_flow_style=False,
+                    sort_keys=False,
+                )
+            else:
+                _emit_runtime_yaml(runtime_info.as_dict(), mfile)
 
         if not ignore_introspection:
             self._introspect()
@@ -873,7 +1273,7 @@ class ModelArtifact(Introspectable):
                 bucket_uri=bucket_uri,
                 remove_existing_artifact=remove_existing_artifact,
             )
-        except oci.exceptions.RequestException as e:
+        except RequestException as e:
             if "The write operation timed out" in str(e):
                 logger.error(
                     "The save operation timed out. Try to set a longer timeout e.g. save(timeout=600, ...)."
@@ -881,13 +1281,9 @@ class ModelArtifact(Introspectable):
 
     def _validate_schema(self):
         if not self._validate_schema_size(self.schema_input, INPUT_SCHEMA_FILE_NAME):
-            self.schema_input.to_json_file(
-                os.path.join(self.artifact_dir, INPUT_SCHEMA_FILE_NAME)
-            )
+            self._write_schema_file(self.schema_input, INPUT_SCHEMA_FILE_NAME)
         if not self._validate_schema_size(self.schema_output, OUTPUT_SCHEMA_FILE_NAME):
-            self.schema_output.to_json_file(
-                os.path.join(self.artifact_dir, OUTPUT_SCHEMA_FILE_NAME)
-            )
+            self._write_schema_file(self.schema_output, OUTPUT_SCHEMA_FILE_NAME)
         self.schema_input.validate_schema()
         self.schema_output.validate_schema()
 
@@ -902,11 +1298,7 @@ class ModelArtifact(Introspectable):
     def _training_code_info(
         self, ns, training_script_path=None, ignore_pending_changes=False
     ):
-        try:
-            repo, training_code_info = self.__fetch_repo_details(ns.TrainingCodeInfo())
-        except git.InvalidGitRepositoryError:
-            repo = None
-            training_code_info = ns.TrainingCodeInfo()
+        repo_dir, training_code_info = self.__fetch_repo_details({})
         if training_script_path is not None:
             if not os.path.exists(training_script_path):
                 logger.warning(
@@ -915,25 +1307,33 @@ class ModelArtifact(Introspectable):
             else:
                 training_script = os.path.abspath(training_script_path)
                 self._assert_path_not_dirty(
-                    training_script_path, repo, ignore_pending_changes
+                    training_script_path, repo_dir, ignore_pending_changes
                 )
-                training_code_info.TRAINING_SCRIPT = training_script
+                training_code_info["TRAINING_SCRIPT"] = training_script
 
-        self._assert_path_not_dirty(self.artifact_dir, repo, ignore_pending_changes)
-        training_code_info.ARTIFACT_DIRECTORY = os.path.abspath(self.artifact_dir)
+        self._assert_path_not_dirty(self.artifact_dir, repo_dir, ignore_pending_changes)
+        training_code_info["ARTIFACT_DIRECTORY"] = os.path.abspath(self.artifact_dir)
 
-        return training_code_info
+        return ns.TrainingCodeInfo(**training_code_info)
 
-    def _assert_path_not_dirty(self, path, repo, ignore):
-        if repo is not None and not ignore:
+    def _assert_path_not_dirty(self, path, repo_dir, ignore):
+        if repo_dir is not None and not ignore:
             path_abs = os.path.abspath(path)
-            if os.path.commonpath([path_abs, repo.working_dir]) == repo.working_dir:
-                path_relpath = os.path.relpath(path_abs, repo.working_dir)
-                if repo.is_dirty(path=path_relpath) or any(
+            # git resolves the symlinks in the repository root
+            path_real = os.path.realpath(path_abs)
+            repo_real = os.path.realpath(repo_dir)
+            if os.path.commonpath([path_real, repo_real]) == repo_real:
+                path_relpath = os.path.relpath(path_real, repo_real)
+                # lists both the modified and the untracked files under the path
+                if _git(
                     [
-                        os.path.commonpath([path_relpath, untracked]) == path_relpath
-                        for untracked in repo.untracked_files
-                    ]
+                        "status",
+                        "--porcelain",
+                        "--untracked-files=all",
+                        "--",
+                        path_relpath,
+                    ],
+                    cwd=repo_dir,
                 ):
                     raise ChangesNotCommitted(path_abs)
 
@@ -949,7 +1349,13 @@ class ModelArtifact(Introspectable):
             IGNORE: Use the installed version in  case of a conflict.
             UPDATE: Force update dependency to the version required by model artifact in case of conflict.
         """
-        importlib.reload(pkg_resources)
+        global _PACKAGES_INSTALLED
+        import pkg_resources
+
+        if _PACKAGES_INSTALLED:
+            # rescan the environment only when pip_install changed it
+            importlib.reload(pkg_resources)
+            _PACKAGES_INSTALLED = False
         from pkg_resources import DistributionNotFound, VersionConflict
 
         if self.version.split(".")[0] not in ["0", "1"] and os.path.exists(
@@ -958,8 +1364,7 @@ class ModelArtifact(Introspectable):
             requirements = (
                 Path(os.path.join(self.artifact_dir), "requirements.txt")
                 .read_text()
-                .strip()
-                .split("\n")
+                .splitlines()
             )
         elif self.version.split(".")[0] in ["0", "1"] and Path(
             os.path.join(self.artifact_dir), "ds-requirements.txt"
@@ -967,8 +1372,7 @@ class ModelArtifact(Introspectable):
             requirements = (
                 Path(os.path.join(self.artifact_dir), "ds-requirements.txt")
                 .read_text()
-                .strip()
-                .split("\n")
+                .splitlines()
             )
         else:
             raise FileNotFoundError(
@@ -976,20 +1380,39 @@ class ModelArtifact(Introspectable):
                 "re-construct the model artifact with install_libs=False."
             )
 
+        requirements = [
+            requirement
+            for requirement in (line.strip() for line in requirements)
+            if requirement and not requirement.startswith("#")
+        ]
+        try:
+            # all the requirements are usually satisfied, which is checked with a
+            # single resolver pass over the working set
+            pkg_resources.working_set.resolve(
+                pkg_resources.parse_requirements(requirements)
+            )
+            return
+        except (VersionConflict, DistributionNotFound):
+            pass
+
         version_conflicts = {}
+        # the packages are installed with a single pip command once all the
+        # requirements are checked
+        packages_to_install = []
         for requirement in requirements:
             try:
                 pkg_resources.require(requirement)
             except VersionConflict as vc:
                 if conflict_strategy == ConflictStrategy.UPDATE:
-                    pip_install("%s%s" % (vc.req.name, vc.req.specifier), "-U")
+                    packages_to_install.append("%s%s" % (vc.req.name, vc.req.specifier))
                 elif conflict_strategy == ConflictStrategy.IGNORE:
                     version_conflicts[
                         "%s==%s" % (vc.dist.key, vc.dist.parsed_version)
                     ] = "%s%s" % (vc.req.name, vc.req.specifier)
             except DistributionNotFound as dnf:
-                pip_install(requirement)
+                packages_to_install.append(requirement)
                 # distributions_not_found.add('%s%s' % (dnf.req.name, dnf.req.specifier))
+        pip_install_many(packages_to_install, "-U")
         if len(version_conflicts) > 0:
             print(
                 "\033[93m"
@@ -997,36 +1420,12 @@ class ModelArtifact(Introspectable):
                 + "\033[0m"
             )
 
-    def _get_files(self):
-        if os.path.exists(os.path.join(self.artifact_dir, ".model-ignore")):
-            ignore_patterns = (
-                Path(os.path.join(self.artifact_dir), ".model-ignore")
-                .read_text()
-                .strip()
-                .split("\n")
-            )
-        else:
-            ignore_patterns = []
-        file_names = []
-        for root, dirs, files in os.walk(self.artifact_dir):
-            for name in files:
-                file_names.append(os.path.join(root, name))
-            for name in dirs:
-                file_names.append(os.path.join(root, name))
-
-        for ignore in ignore_patterns:
-            if not ignore.startswith("#") and ignore.strip() != "":
-                matches = []
-                for file_name in file_names:
-                    if ignore.endswith("/"):
-                        ignore = ignore[:-1] + "*"
-                    if not re.search(
-                        fnmatch.translate("/%s" % ignore.strip()), file_name
-                    ):
-                        matches.append(file_name)
-                file_names = matches
+    def _get_files(self, remove_pycache=False):
         return [
-            matched_file[len(self.artifact_dir) + 1 :] for matched_file in file_names
+            file_name
+            for file_name, _ in _iter_artifact_files(
+                self.artifact_dir, remove_pycache=remove_pycache
+            )
         ]
 
     def _save_data_from_memory(
@@ -1089,11 +1488,13 @@ class ModelArtifact(Introspectable):
         >>> generic_model_artifact._save_data_from_memory(prefix = 'oci://bucket_name@namespace/folder_name',
         ... train_data=df, storage_options=storage_options)
         """
-        if not re.match(r"oci://*@*", prefix):
+        if not _OCI_PREFIX_PATTERN.match(prefix):
             raise InvalidObjectStoragePath(
                 "`prefix` is not valid. It must have the pattern 'oci://bucket_name@namespace/key'."
             )
         if not storage_options:
+            import ads.dataset.factory as factory
+
             storage_options = factory.default_storage_options
         if not storage_options:
             storage_options = {"config": {}}
@@ -1175,11 +1576,13 @@ class ModelArtifact(Introspectable):
         >>> generic_model_artifact._save_data_from_file(oci_storage_path = 'oci://bucket_name@namespace/folder_name',
         ... train_data_path = '~/orcl_attrition*.csv', storage_options=storage_options)
         """
-        if not re.match(r"oci://*@*", prefix):
+        if not _OCI_PREFIX_PATTERN.match(prefix):
             raise InvalidObjectStoragePath(
                 "`prefix` is not valid. It must have the pattern 'oci://bucket_name@namespace/key'."
             )
         if not storage_options:
+            import ads.dataset.factory as factory
+
             storage_options = factory.default_storage_options
         if not storage_options:
             storage_options = {"config": {}}
@@ -1256,6 +1659,28 @@ class ModelArtifact(Introspectable):
                     value=None
                 )
 
+    def _model_artifacts_metadata_item(self, files: List[str] = None):
+        """Builds the custom metadata item listing the files of the model artifact.
+
+        Parameters
+        ----------
+        files: (List[str], optional). Defaults to None.
+            The files of the model artifact. Listed with `_get_files` when not provided.
+
+        Returns
+        -------
+        ModelCustomMetadataItem
+            The `ModelArtifacts` metadata item.
+        """
+        return ModelCustomMetadataItem(
+            key=MetadataCustomKeys.MODEL_ARTIFACTS,
+            value=_shorten_join(
+                self._get_files() if files is None else files, 255, placeholder="..."
+            ),
+            description="A list of files located in the model artifacts folder.",
+            category=MetadataCustomCategory.TRAINING_ENV,
+        )
+
     def _populate_metadata_custom(self):
         """Extracts custom metadata from the model artifact.
 
@@ -1275,23 +1700,14 @@ class ModelArtifact(Introspectable):
             )
         )
         try:
-            env_type = (
-                self._runtime_info.MODEL_DEPLOYMENT.INFERENCE_CONDA_ENV.INFERENCE_ENV_TYPE._value
-            )
-        except:
-            env_type = None
-        try:
-            slug_name = (
-                self._runtime_info.MODEL_DEPLOYMENT.INFERENCE_CONDA_ENV.INFERENCE_ENV_SLUG._value
-            )
+            inference_conda_env = self._runtime_info["MODEL_DEPLOYMENT"][
+                "INFERENCE_CONDA_ENV"
+            ]
         except:
-            slug_name = None
-        try:
-            env_path = (
-                self._runtime_info.MODEL_DEPLOYMENT.INFERENCE_CONDA_ENV.INFERENCE_ENV_PATH._value
-            )
-        except:
-            env_path = None
+            inference_conda_env = {}
+        env_type = inference_conda_env.get("INFERENCE_ENV_TYPE")
+        slug_name = inference_conda_env.get("INFERENCE_ENV_SLUG")
+        env_path = inference_conda_env.get("INFERENCE_ENV_PATH")
 
         model_metadata_items.append(
             ModelCustomMetadataItem(
@@ -1317,16 +1733,7 @@ class ModelArtifact(Introspectable):
                 category=MetadataCustomCategory.TRAINING_ENV,
             )
         )
-        model_metadata_items.append(
-            ModelCustomMetadataItem(
-                key=MetadataCustomKeys.MODEL_ARTIFACTS,
-                value=textwrap.shorten(
-                    ", ".join(self._get_files()), 255, placeholder="..."
-                ),
-                description="A list of files located in the model artifacts folder.",
-                category=MetadataCustomCategory.TRAINING_ENV,
-            )
-        )
+        model_metadata_items.append(self._model_artifacts_metadata_item())
         model_metadata_items.append(
             ModelCustomMetadataItem(
                 key=MetadataCustomKeys.MODEL_SERIALIZATION_FORMAT,
@@ -1404,81 +1811,114 @@ class ModelArtifact(Introspectable):
                 f"`{type(data)}` is not supported. Use a Pandas DataFrame."
             )
 
-        self._save_data_path(oci_storage_path, data_type)
-        self._save_data_shape(data, data_type)
+        self.metadata_custom._add_many(
+            [
+                self._data_path_item(oci_storage_path, data_type),
+                self._data_shape_item(data, data_type),
+            ],
+            replace=True,
+        )
 
     def _save_from_local_file(
         self, prefix, file_path, storage_options, data_type="training"
     ):
         """Save local file to Object Storage."""
         file_path = os.path.expanduser(file_path)
-        import glob
+        import fsspec
 
-        if len(glob.glob(file_path)) == 0:
+        local_files = fsspec.open_files(file_path, mode="rb")
+        # a path without wildcards is returned whether the file exists or not
+        if len(local_files) == 0 or not local_files[0].fs.exists(local_files[0].path):
             raise FileExistsError(f"No files were found in `{file_path}`.")
-        oci_storage_paths = []
-        with fsspec.open_files(file_path, mode="r") as fhs:
-            for fh in fhs:
+
+        def upload(local_file):
+            with local_file as fh:
                 oci_storage_path = os.path.join(prefix, os.path.basename(fh.name))
                 with fsspec.open(
                     oci_storage_path,
-                    mode="w",
+                    mode="wb",
                     **(storage_options),
                 ) as f:
-                    f.write(fh.read())
-                oci_storage_paths.append(oci_storage_path)
-                self._save_file_size(
-                    os.path.join(os.path.dirname(file_path), os.path.basename(fh.name)),
+                    shutil.copyfileobj(fh, f, length=_UPLOAD_CHUNK_SIZE)
+                # the whole file has been read, the position is the size of the file
+                size = fh.tell()
+            return oci_storage_path, size
+
+        # the uploads are I/O bound, the files are sent to Object Storage in parallel
+        with ThreadPoolExecutor(
+            max_workers=min(len(local_files), DATA_UPLOAD_MAX_WORKERS)
+        ) as pool:
+            uploaded_files = list(pool.map(upload, local_files))
+
+        oci_storage_paths = [oci_storage_path for oci_storage_path, _ in uploaded_files]
+        # every file size is stored under the same key, the last uploaded file wins
+        last_storage_path, last_size = uploaded_files[-1]
+        self.metadata_custom._add_many(
+            [
+                self._file_size_item(
+                    os.path.join(
+                        os.path.dirname(file_path), os.path.basename(last_storage_path)
+                    ),
                     data_type,
-                )
-        self._save_data_path(",  ".join(oci_storage_paths), data_type)
-
-    def _save_data_path(self, oci_storage_path, data_type):
+                    size=last_size,
+                ),
+                self._data_path_item(",  ".join(oci_storage_paths), data_type),
+            ],
+            replace=True,
+        )
 
+    def _data_path_item(self, oci_storage_path, data_type):
         key = (
             MetadataCustomKeys.TRAINING_DATASET
             if data_type == "training"
             else MetadataCustomKeys.VALIDATION_DATASET
         )
-        self.metadata_custom._add(
-            ModelCustomMetadataItem(
-                key=key,
-                value=oci_storage_path,
-                description=f"The path to where the {data_type} dataset is stored on Object Storage.",
-                category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
-            ),
-            replace=True,
+        return ModelCustomMetadataItem(
+            key=key,
+            value=oci_storage_path,
+            description=f"The path to where the {data_type} dataset is stored on Object Storage.",
+            category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
         )
 
-    def _save_data_shape(self, data, data_type):
+    def _data_shape_item(self, data, data_type):
         key = (
             MetadataCustomKeys.TRAINING_DATASET_SIZE
             if data_type == "training"
             else MetadataCustomKeys.VALIDATION_DATASET_SIZE
         )
+        return ModelCustomMetadataItem(
+            key=key,
+            value=str(data.shape),
+            description=f"The size of the {data_type} dataset in bytes.",
+            category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
+        )
+
+    def _file_size_item(self, file_path, data_type, size=None):
+        key = (
+            MetadataCustomKeys.TRAINING_DATASET_SIZE
+            if data_type == "training"
+            else MetadataCustomKeys.VALIDATION_DATASET_SIZE
+        )
+        if size is None:
+            size = os.stat(file_path).st_size
+        return ModelCustomMetadataItem(
+            key=key,
+            value=str(size) + " bytes",
+            description=f"The {data_type} dataset size in bytes.",
+            category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
+        )
+
+    def _save_data_path(self, oci_storage_path, data_type):
         self.metadata_custom._add(
-            ModelCustomMetadataItem(
-                key=MetadataCustomKeys.TRAINING_DATASET_SIZE
-                if data_type == "training"
-                else MetadataCustomKeys.VALIDATION_DATASET_SIZE,
-                value=str(data.shape),
-                description=f"The size of the {data_type} dataset in bytes.",
-                category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
-            ),
-            replace=True,
+            self._data_path_item(oci_storage_path, data_type), replace=True
         )
 
-    def _save_file_size(self, file_path, data_type):
+    def _save_data_shape(self, data, data_type):
+        self.metadata_custom._add(self._data_shape_item(data, data_type), replace=True)
+
+    def _save_file_size(self, file_path, data_type, size=None):
         self.metadata_custom._add(
-            ModelCustomMetadataItem(
-                key=MetadataCustomKeys.TRAINING_DATASET_SIZE
-                if data_type == "training"
-                else MetadataCustomKeys.VALIDATION_DATASET_SIZE,
-                value=str(os.stat(file_path).st_size) + " bytes",
-                description=f"The {data_type} dataset size in bytes.",
-                category=MetadataCustomCategory.TRAINING_AND_VALIDATION_DATASETS,
-            ),
-            replace=True,
+            self._file_size_item(file_path, data_type, size=size), replace=True
         )
 
     def _prepare_data_for_schema(
@@ -1514,12 +1954,13 @@ class ModelArtifact(Introspectable):
             The maximum column size of the data that allows to auto generate schema.
         """
         if data_sample is not None:
-            assert isinstance(
-                data_sample, ADSData
-            ), "`data_sample` expects data of ADSData type. \
-            Pass in to `X_sample` and `y_sample` for other data types."
-            X_sample = data_sample.X
-            y_sample = data_sample.y
+            try:
+                X_sample, y_sample = data_sample.X, data_sample.y
+            except AttributeError:
+                raise TypeError(
+                    "`data_sample` expects data of ADSData type. "
+                    "Pass in to `X_sample` and `y_sample` for other data types."
+                )
         X_sample, y_sample = self._prepare_data_for_schema(X_sample, y_sample)
         self.schema_input = self._populate_schema(
             X_sample,
@@ -1559,11 +2000,20 @@ class ModelArtifact(Introspectable):
 
         try:
             if data is not None:
-                data = utils.to_dataframe(data)
+                if not isinstance(data, pd.DataFrame):
+                    data = utils.to_dataframe(data)
                 schema = data.ads.model_schema(max_col_num=max_col_num)
-                schema.to_json_file(os.path.join(self.artifact_dir, schema_file_name))
+                # the schema is saved to the artifact directory only when it does
+                # not fit in the model catalog metadata
                 if self._validate_schema_size(schema, schema_file_name):
                     result = schema
+                    # a schema file left by an earlier, oversized schema is stale now
+                    try:
+                        os.remove(os.path.join(self.artifact_dir, schema_file_name))
+                    except FileNotFoundError:
+                        pass
+                else:
+                    self._write_schema_file(schema, schema_file_name)
         except DataSizeTooWide:
             logger.warning(
                 f"The data has too many columns and "
@@ -1573,7 +2023,23 @@ class ModelArtifact(Introspectable):
 
         return result or Schema()
 
+    def _write_schema_file(self, schema, schema_file_name):
+        """Saves the schema into the artifact directory, unless the file already
+        contains the same schema."""
+        file_path = os.path.join(self.artifact_dir, schema_file_name)
+        content = json.dumps(schema.to_dict())
+        try:
+            with open(file_path, "r") as json_file:
+                if json_file.read() == content:
+                    return
+        except OSError:
+            pass
+        with open(file_path, "w") as json_file:
+            json_file.write(content)
+
     def _validate_schema_size(self, schema, schema_file_name):
+        if len(schema) == 0:
+            return True
         result = False
         try:
             result = schema.validate_size()
@@ -1700,26 +2166,53 @@ class VersionConflictWarning(object):
         self.version_conflicts = version_conflicts
 
     def __str__(self):
-        msg = "WARNING: Version conflicts found:"
-        if len(self.version_conflicts) > 0:
-            for lib in self.version_conflicts:
-                msg += "\nInstalled: %s, Required: %s" % (
-                    lib,
-                    self.version_conflicts[lib],
-                )
-        return msg
+        lines = ["WARNING: Version conflicts found:"]
+        lines.extend(
+            f"Installed: {lib}, Required: {required}"
+            for lib, required in self.version_conflicts.items()
+        )
+        return "\n".join(lines)
 
 
 def pip_install(package, options="-U"):
-    package = re.sub(r"<|>", "=", package.split(",")[0])
-    for output in execute(["pip", "install", options, package]):
+    pip_install_many([package], options=options)
+
+
+def pip_install_many(packages, options="-U"):
+    """Installs the packages with a single pip command.
+
+    Parameters
+    ----------
+    packages: List[str]
+        The requirements of the packages to install.
+    options: (str, optional). Defaults to "-U".
+        The option passed to `pip install`.
+    """
+    global _PACKAGES_INSTALLED
+    if not packages:
+        return
+    packages = [
+        package.split(",", 1)[0].translate(_VERSION_OPERATOR_TABLE)
+        for package in packages
+    ]
+    for output in execute(["pip", "install", options] + packages):
         print(output, end="")
+    _PACKAGES_INSTALLED = True
 
 
 def execute(cmd):
-    popen = subprocess.Popen(cmd, stdout=subprocess.PIPE, universal_newlines=True)
-    for stdout_line in iter(popen.stdout.readline, ""):
-        yield stdout_line
+    popen = subprocess.Popen(cmd, stdout=subprocess.PIPE, bufsize=0)
+    # the output is read in chunks of whatever is available in the pipe instead of
+    # line by line, the chunks are decoded incrementally as they are received
+    decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(
+        errors="replace"
+    )
+    read_chunk = functools.partial(os.read, popen.stdout.fileno(), _EXECUTE_READ_SIZE)
+    for chunk in iter(read_chunk, b""):
+        yield decoder.decode(chunk)
+    tail = decoder.decode(b"", final=True)
+    if tail:
+        yield tail
     popen.stdout.close()
     return_code = popen.wait()
     if return_code:
@@ -1734,18 +2227,21 @@ def fetch_manifest_from_conda_location(env_location: str):
     :type env_location: str
     """
     manifest_location = None
-    for file in os.listdir(env_location):
-        if file.endswith("_manifest.yaml"):
-            manifest_location = f"{env_location}/{file}"
-            break
+    entries = []
+    with os.scandir(env_location) as it:
+        for entry in it:
+            entries.append(entry.name)
+            if entry.name.endswith("_manifest.yaml") and entry.is_file():
+                manifest_location = f"{env_location}/{entry.name}"
+                break
     env = {}
     if not manifest_location:
         raise Exception(
             f"Could not locate manifest file in the provided conda environment: {env_location}. Dir Listing - "
-            f"{os.listdir(env_location)}"
+            f"{entries}"
         )
 
     with open(manifest_location) as mlf:
-        env = yaml.load(mlf, Loader=yaml.FullLoader)
+        env = yaml.load(mlf, Loader=loader)
     manifest = env["manifest"]
     return manifest
@@ -27,6 +27,7 @@ Examples
 """
 from enum import Enum
 import errno
+import hashlib
 import importlib
 import json
 import os
@@ -54,6 +55,11 @@ _PATH_TO_MODEL_ARTIFACT_VALIDATOR = (
 )
 _INTROSPECT_METHOD_NAME = "validate_artifact"
 _INTROSPECT_RESULT_FILE_NAME = "test_json_output.json"
+# The small files which ModelArtifact.save() writes again right before the
+# introspection. Their content is hashed, as their modification time always changes.
+_CONTENT_FINGERPRINT_FILE_NAMES = frozenset(
+    ("runtime.yaml", "input_schema.json", "output_schema.json")
+)
 
 
 class _PRINT_COLUMNS(Enum):
@@ -165,6 +171,45 @@ class ModelIntrospect:
         self._status = TEST_STATUS.NOT_TESTED
         self._result = None
         self._prepared_result = []
+        self._fingerprint = None
+
+    def _artifact_fingerprint(self) -> str:
+        """Computes the fingerprint of the model artifacts.
+
+        The fingerprint is built from the relative path, the size and the modification
+        time of every file listed for the model artifacts, the introspection result file
+        and the `__pycache__` folders excluded. The files rewritten by `save()` are
+        fingerprinted by their content instead.
+
+        Returns
+        -------
+        str
+            The fingerprint of the model artifacts.
+        """
+        # imported here, ads.common.model_artifact depends on this module
+        from ads.common.model_artifact import _iter_artifact_files
+
+        digest = hashlib.blake2b(digest_size=16)
+        for relpath, entry in sorted(
+            _iter_artifact_files(self._artifact.artifact_dir), key=lambda item: item[0]
+        ):
+            if (
+                relpath == _INTROSPECT_RESULT_FILE_NAME
+                or "__pycache__" in relpath.split(os.sep)
+                or not entry.is_file()
+            ):
+                continue
+            if relpath in _CONTENT_FINGERPRINT_FILE_NAMES:
+                with open(entry.path, "rb") as f:
+                    content = f.read()
+                digest.update(f"{relpath}\0{len(content)}\0".encode())
+                digest.update(content)
+            else:
+                stat = entry.stat()
+                digest.update(
+                    f"{relpath}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+                )
+        return digest.hexdigest()
 
     def _save_result_to_artifacts(self) -> None:
         """Saves introspection result into the model artifacts folder.
@@ -238,10 +283,19 @@ class ModelIntrospect:
         pd.DataFrame
            The introspection result in a DataFrame format.
         """
+        if (
+            self._fingerprint is not None
+            and self._fingerprint == self._artifact_fingerprint()
+        ):
+            # the model artifacts did not change since the last run
+            self._save_result_to_metadata()
+            self._save_result_to_artifacts()
+            return self.to_dataframe()
         self._reset()
         self._import_and_run_validator()
         self._save_result_to_metadata()
         self._save_result_to_artifacts()
+        self._fingerprint = self._artifact_fingerprint()
         return self.to_dataframe()
 
     def _prepare_result(self) -> List[PrintItem]:
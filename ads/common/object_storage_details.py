@@ -9,12 +9,16 @@ import os
 import re
 from dataclasses import dataclass
 from typing import Dict
-from urllib.parse import urlparse
 
 from ads.common import auth as authutil
 from ads.common import oci_client
 
 
+_OCI_PATH_PATTERN = re.compile(
+    r"^oci://(?P<bucket>[^@/]+)@(?P<namespace>[^/]+)(?P<path>/.*)?$"
+)
+
+
 class InvalidObjectStoragePath(Exception):
     """Invalid Object Storage Path."""
 
@@ -82,17 +86,17 @@ class ObjectStorageDetails:
         ObjectStorageDetails
             An ObjectStorageDetails instance.
         """
-        try:
-            url_parse = urlparse(env_path)
-            bucket_name = url_parse.username
-            namespace = url_parse.hostname
-            object_name = url_parse.path.strip("/")
-            return cls(bucket=bucket_name, namespace=namespace, filepath=object_name)
-        except:
+        match = _OCI_PATH_PATTERN.match(env_path) if env_path else None
+        if not match:
             raise Exception(
                 "OCI path is not properly configured. "
                 "It should follow the pattern `oci://<bucket-name>@<namespace>/object_path`."
             )
+        return cls(
+            bucket=match["bucket"],
+            namespace=match["namespace"].lower(),
+            filepath=(match["path"] or "").strip("/"),
+        )
 
     def to_tuple(self):
         """Returns the values of the fields of ObjectStorageDetails class."""
@@ -4,17 +4,28 @@
 # Copyright (c) 2020, 2022 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
-from mlx import LimeExplainer
-from mlx import FDExplainer, AleExplainer
-from mlx import PermutationImportance
 from ads.common import logger
-from ads.dataset.helper import is_text_data
-from mlx.whatif import WhatIf
-import pandas as pd
+import weakref
+
+# The dataset types found by `check_tabular_or_text`, keyed by the id of the dataset.
+# Each entry holds a weak reference to the dataset and its shape, so that a recycled
+# id or a reshaped dataset is not mistaken for the cached one.
+_DATASET_TYPE_CACHE = {}
 
 
 def _reset_index(x):
+    import pandas as pd
+
     assert isinstance(x, pd.DataFrame) or isinstance(x, pd.Series)
+    index = x.index
+    if (
+        isinstance(index, pd.RangeIndex)
+        and index.start == 0
+        and index.step == 1
+        and index.name is None
+    ):
+        # the index is already the default one, avoid copying the data
+        return x
     return x.reset_index(drop=True)
 
 
@@ -34,7 +45,23 @@ def check_tabular_or_text(est, X):
     str
         "text" or "tabular"
     """
-    return "text" if is_text_data(X) else "tabular"
+    key = id(X)
+    cached = _DATASET_TYPE_CACHE.get(key)
+    if cached is not None:
+        ref, shape, dataset_type = cached
+        if ref() is X and shape == getattr(X, "shape", None):
+            return dataset_type
+
+    from ads.dataset.helper import is_text_data
+
+    dataset_type = "text" if is_text_data(X) else "tabular"
+    try:
+        ref = weakref.ref(X, lambda _, key=key: _DATASET_TYPE_CACHE.pop(key, None))
+    except TypeError:
+        # the dataset does not support weak references, it is not cached
+        return dataset_type
+    _DATASET_TYPE_CACHE[key] = (ref, getattr(X, "shape", None), dataset_type)
+    return dataset_type
 
 
 def init_lime_explainer(
@@ -105,6 +132,8 @@ def init_lime_explainer(
     ------
     :class:`mlx.LimeExplainer`
     """
+    from mlx import LimeExplainer
+
     if explainer is None:
         exp = LimeExplainer()
     else:
@@ -183,6 +212,8 @@ def init_permutation_importance_explainer(
     ------
     :class:`mlx.PermutationImportance`
     """
+    from mlx import PermutationImportance
+
     if explainer is None:
         exp = PermutationImportance()
     else:
@@ -250,6 +281,8 @@ def init_partial_dependence_explainer(
     ------
     :class:`mlx.FDExplainer`
     """
+    from mlx import FDExplainer
+
     if explainer is None:
         exp = FDExplainer()
     else:
@@ -303,6 +336,8 @@ def init_ale_explainer(
     ------
     :class:`mlx.FDExplainer`
     """
+    from mlx import AleExplainer
+
     if explainer is None:
         exp = AleExplainer()
     else:
@@ -322,6 +357,79 @@ def init_ale_explainer(
     return exp
 
 
+def init_all_explainers(
+    est,
+    X_train,
+    y_train,
+    mode,
+    class_names=None,
+    selected_features=None,
+    client=None,
+):
+    """
+    Initializes the LIME, Permutation Importance, Partial Dependence and ALE explainers
+    on the same training dataset.
+
+    The type of the dataset is detected once and shared by all the explainers. For
+    text datasets only the LIME explainer is initialized, the global feature importance
+    and feature dependence explainers are not supported for text datasets.
+
+    Parameters
+    ----------
+    est : ADSModel
+        Model to explain.
+    X_train : pandas.DataFrame
+        Training dataset.
+    y_train : pandas.DataFrame/Series
+        Training labels.
+    mode : str
+        'classification' or 'regression'.
+    class_names : list, optional
+        List of target names. Default value is `None`.
+    selected_features : list[int], optional
+        Pass the selected features information to the explainers. Defaults value is `None`.
+    client : Dask Client, optional
+        Specifies that Dask Client object to use in MLX. If `None`, no parallelization.
+
+    Return
+    ------
+    dict
+        The initialized explainers keyed by "lime", "permutation_importance",
+        "partial_dependence" and "ale".
+    """
+    explainers = {
+        "lime": init_lime_explainer(
+            None,
+            est,
+            X_train,
+            y_train,
+            mode,
+            class_names=class_names,
+            selected_features=selected_features,
+            client=client,
+        )
+    }
+    if check_tabular_or_text(est, X_train) == "text":
+        return explainers
+    explainers["permutation_importance"] = init_permutation_importance_explainer(
+        None,
+        est,
+        X_train,
+        y_train,
+        mode,
+        class_names=class_names,
+        selected_features=selected_features,
+        client=client,
+    )
+    explainers["partial_dependence"] = init_partial_dependence_explainer(
+        None, est, X_train, y_train, mode, class_names=class_names, client=client
+    )
+    explainers["ale"] = init_ale_explainer(
+        None, est, X_train, y_train, mode, class_names=class_names, client=client
+    )
+    return explainers
+
+
 def init_whatif_explainer(
     explainer,
     est,
@@ -334,6 +442,8 @@ def init_whatif_explainer(
     random_state=42,
     **kwargs,
 ):
+    from mlx.whatif import WhatIf
+
     if explainer is None:
         width = kwargs.get("width", 1100)
         exp = WhatIf(mode=mode, random_state=random_state, width=width)
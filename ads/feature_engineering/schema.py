@@ -736,8 +736,9 @@ class Schema:
         SchemaSizeTooLarge
             If the size of the schema exceeds expected value.
         """
-        if sys.getsizeof(self.to_yaml()) > INPUT_OUTPUT_SCHENA_SIZE_LIMIT:
-            raise SchemaSizeTooLarge(sys.getsizeof(self.to_yaml()))
+        size = sys.getsizeof(self.to_yaml())
+        if size > INPUT_OUTPUT_SCHENA_SIZE_LIMIT:
+            raise SchemaSizeTooLarge(size)
         return True
 
     def validate_schema(self):
@@ -13,6 +13,11 @@ from ads.jobs.builders.runtimes.base import Runtime
 from ads.common.auth import default_signer
 from ads.opctl.config.utils import convert_notebook
 
+_JSON_WHITESPACE = " \t\n\r"
+# The first characters of the JSON values accepted by json.loads(),
+# including NaN and Infinity.
+_JSON_PREFIXES = frozenset('{["-0123456789tfnNI')
+
 
 class CondaRuntime(Runtime):
     """Represents a job runtime with conda pack"""
@@ -236,14 +241,14 @@ class _PythonRuntimeMixin(Runtime):
         self
             The runtime instance.
         """
-        python_paths = list(python_paths)
-        for path in python_paths:
-            if os.path.isabs(path):
-                raise ValueError(
-                    f"{path} is an absolute path."
-                    "Please specify relative path from the working directory as python path."
-                )
-        return self.set_spec(self.CONST_PYTHON_PATH, python_paths)
+        path = next(filter(os.path.isabs, python_paths), None)
+        if path is not None:
+            raise ValueError(
+                f"{path} is an absolute path."
+                "Please specify relative path from the working directory as python path."
+            )
+        # The paths are stored as a list, which is serialized to YAML and JSON as is.
+        return self.set_spec(self.CONST_PYTHON_PATH, list(python_paths))
 
     def with_entrypoint(self, path: str, func: str = None):
         """Specifies the entrypoint for the job.
@@ -513,6 +518,10 @@ class GitPythonRuntime(CondaRuntime, _PythonRuntimeMixin):
         if arg is None:
             return None
         if isinstance(arg, str):
+            # A JSON payload can only start with one of these characters,
+            # any other string is returned without trying to parse it.
+            if arg.lstrip(_JSON_WHITESPACE)[:1] not in _JSON_PREFIXES:
+                return arg
             try:
                 json.loads(arg)
             except json.JSONDecodeError:
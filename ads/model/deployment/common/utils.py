@@ -8,20 +8,18 @@
 
 # Standard lib
 
+import functools
 import json
 import logging
 import os
 import shutil
 import tempfile
 import time
-from typing import Dict
+import zipfile
+from typing import BinaryIO, Dict
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum, auto
 
-import oci
-import fsspec
-from oci.data_science.models import CreateModelDetails
-from ads.common.auth import default_signer
-from ads.common.oci_client import OCIClientFactory
 from ads.common.decorator.runtime_dependency import (
     runtime_dependency,
     OptionalDependency,
@@ -31,6 +29,13 @@ from .progress_bar import TqdmProgressBar, DummyProgressBar
 
 logger = logging.getLogger(__name__)
 
+# The number of seconds after which a model file cached by prepare_artifact is
+# downloaded again.
+ARTIFACT_CACHE_EXPIRY_TIME = 24 * 60 * 60
+ARTIFACT_FETCH_MAX_WORKERS = 16
+_ZIP_CHUNK_SIZE = 1 << 20
+_ZIP_SPOOL_MAX_SIZE = 64 << 20
+
 
 def get_logger():
     return logger
@@ -64,6 +69,7 @@ def seconds_since(t):
     return time.time() - t
 
 
+@functools.lru_cache(maxsize=1)
 @runtime_dependency(module="IPython", install_from=OptionalDependency.NOTEBOOK)
 def is_notebook():
     """is_notebook returns True if the environment is a Jupyter notebook and
@@ -73,7 +79,8 @@ def is_notebook():
         None
 
     Returns:
-        bool: True if Jupyter notebook; False otherwise
+        bool: True if Jupyter notebook; False otherwise. The result is computed
+        once per process.
 
     Raises:
         NameError: If retrieving the shell name from get_ipython() throws an error
@@ -130,22 +137,7 @@ class State(Enum):
     def _from_str(state):
         if state == None:
             return State.UNKNOWN
-        elif state.upper() == "ACTIVE":
-            return State.ACTIVE
-        elif state.upper() == "CREATING":
-            return State.CREATING
-        elif state.upper() == "DELETED":
-            return State.DELETED
-        elif state.upper() == "DELETING":
-            return State.DELETING
-        elif state.upper() == "FAILED":
-            return State.FAILED
-        elif state.upper() == "INACTIVE":
-            return State.INACTIVE
-        elif state.upper() == "UPDATING":
-            return State.UPDATING
-        else:
-            return State.UNKNOWN
+        return State.__members__.get(state.upper(), State.UNKNOWN)
 
     def __call__(self):
         # This will provide backward compatibility.
@@ -153,6 +145,42 @@ class State(Enum):
         return self
 
 
+def _default_auth_key():
+    """Returns the ads.set_auth() settings used by default_signer()."""
+    from ads.common import utils
+
+    return (
+        utils.is_resource_principal_mode(),
+        utils.oci_config_location(),
+        utils.oci_key_profile(),
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _default_clients(auth_key):
+    """Creates the default signer and the data science clients for the
+    authentication settings identified by `auth_key`.
+
+    Args:
+        auth_key (tuple): the authentication settings, as returned by _default_auth_key()
+
+    Returns:
+        tuple: the signer config, the DataScienceClient and the
+        DataScienceClientCompositeOperations
+    """
+    import oci
+    from ads.common.auth import default_signer
+    from ads.common.oci_client import OCIClientFactory
+
+    config = default_signer()
+    ds_client = OCIClientFactory(**config).data_science
+    return (
+        config,
+        ds_client,
+        oci.data_science.DataScienceClientCompositeOperations(ds_client),
+    )
+
+
 class OCIClientManager:
     """OCIClientManager is a helper class used for accessing DataScienceClient and
     DataScienceCompositeClient objects
@@ -166,7 +194,17 @@ class OCIClientManager:
 
     def __init__(self, config=None) -> None:
         if not config:
-            config = default_signer()
+            # The clients built from the default authentication are shared by the
+            # managers created with the same ads.set_auth() settings.
+            self.config, self.ds_client, self.ds_composite_client = _default_clients(
+                _default_auth_key()
+            )
+            return
+        # oci is imported here, so that importing this module for the logger,
+        # the State enum or the progress bars does not load the OCI SDK.
+        import oci
+        from ads.common.oci_client import OCIClientFactory
+
         self.config = config
         self.ds_client = OCIClientFactory(**config).data_science
         self.ds_composite_client = (
@@ -207,7 +245,9 @@ class OCIClientManager:
             or getattr(signer, "tenancy_id", None)
         )
 
-    def prepare_artifact(self, model_uri: str, properties: Dict) -> str:
+    def prepare_artifact(
+        self, model_uri: str, properties: Dict, cache_dir: str = None
+    ) -> str:
         """
         Prepare model artifact. Returns model ocid.
 
@@ -215,50 +255,100 @@ class OCIClientManager:
             model_uri (str): uri to model files, can be local or in cloud storage
             properties (dict): dictionary of properties that are needed for creating a model.
             ds_client (DataScienceClient): OCI DataScienceClient
+            cache_dir (str, optional): local folder to cache the remote model files in, so that
+                preparing the artifact again only downloads the files which have changed.
+                The cached files expire after ARTIFACT_CACHE_EXPIRY_TIME seconds.
+                Defaults to None, the files are not cached.
 
         Returns:
             str: model ocid
         """
+        import fsspec
+
         if properties:
             properties_dict = (
                 properties
                 if isinstance(properties, dict)
                 else json.loads(repr(properties))
             )
+        storage_options = {"config": self.config.get("config", {})}
+        protocol = fsspec.core.split_protocol(model_uri)[0]
+        cached = cache_dir is not None and protocol not in (None, "file")
+        if cached:
+            model_uri = f"filecache::{model_uri}"
+            storage_options = {
+                protocol: storage_options,
+                "filecache": {
+                    "cache_storage": cache_dir,
+                    "check_files": True,
+                    "expiry_time": ARTIFACT_CACHE_EXPIRY_TIME,
+                },
+            }
+        fhandlers = fsspec.open_files(model_uri, mode="rb", **storage_options)
+        if len(fhandlers) == 0:
+            raise FileNotFoundError("No files found under this path.")
+        # a glob can match the same file more than once, it is only fetched once
+        fhandlers = list({fh.path: fh for fh in fhandlers}.values())
+        names = {}
+        for fh in fhandlers:
+            name = os.path.basename(fh.path)
+            if name in names:
+                raise ValueError(
+                    f"Both {names[name]} and {fh.path} would be saved as {name} "
+                    "in the model artifact."
+                )
+            names[name] = fh.path
         with tempfile.TemporaryDirectory() as d:
-            fhandlers = fsspec.open_files(
-                model_uri,
-                config=self.config.get("config", {}),
-                mode="rb",
-            )
-            if len(fhandlers) == 0:
-                raise FileNotFoundError("No files found under this path.")
-            for fh in fhandlers:
-                with fh as fin:
-                    with open(os.path.join(d, os.path.basename(fh.path)), "wb") as fout:
-                        fout.write(fin.read())
-            shutil.make_archive(
-                os.path.join(os.path.dirname(d), "model_files"),
-                "zip",
-                os.path.dirname(d),
-                os.path.basename(d),
-            )
-            return self._upload_artifact(
-                f"{os.path.join(os.path.dirname(d), 'model_files')}.zip",
-                properties_dict,
-            )
 
-    def _upload_artifact(self, model_zip: str, properties: dict) -> str:
+            def _fetch(item):
+                index, fh = item
+                if cached:
+                    # opening the file downloads it into the cache, the archive
+                    # is then written from the cached copy
+                    with fh:
+                        return fh, None
+                local_path = os.path.join(d, str(index))
+                with fh as fin, open(local_path, "wb") as fout:
+                    shutil.copyfileobj(fin, fout, length=_ZIP_CHUNK_SIZE)
+                return fh, local_path
+
+            # the remote files are fetched concurrently, while the archive is
+            # written in the original order as the downloads complete. Small
+            # archives are kept in memory and uploaded without touching the disk.
+            with tempfile.SpooledTemporaryFile(
+                max_size=_ZIP_SPOOL_MAX_SIZE
+            ) as model_zip:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(fhandlers), ARTIFACT_FETCH_MAX_WORKERS)
+                ) as pool, zipfile.ZipFile(
+                    model_zip, "w", zipfile.ZIP_DEFLATED, allowZip64=True
+                ) as zf:
+                    for fh, local_path in pool.map(_fetch, enumerate(fhandlers)):
+                        name = os.path.basename(fh.path)
+                        if local_path is None:
+                            with fh as fin, zf.open(
+                                name, "w", force_zip64=True
+                            ) as zout:
+                                shutil.copyfileobj(fin, zout, length=_ZIP_CHUNK_SIZE)
+                        else:
+                            zf.write(local_path, arcname=name)
+                            os.remove(local_path)
+                model_zip.seek(0)
+                return self._upload_artifact(model_zip, properties_dict)
+
+    def _upload_artifact(self, model_zip: BinaryIO, properties: dict) -> str:
         """Uploads the model artifact to cloud storage.
 
         Args:
             ds_client (DataScienceClient): OCI DataScienceClient
-            model_zip (str): path to model artifact zip file
+            model_zip (BinaryIO): file object of the model artifact zip file
             properties (dict): dictionary of properties
 
         Returns:
             str: model ocid
         """
+        from oci.data_science.models import CreateModelDetails
+
         create_model_details = CreateModelDetails(
             display_name=properties.get("display_name", None),
             project_id=properties["project_id"],
@@ -266,10 +356,9 @@ class OCIClientManager:
         )
 
         model = self.ds_client.create_model(create_model_details).data
-        with open(model_zip, "rb") as data:
-            self.ds_client.create_model_artifact(
-                model.id,
-                data,
-                content_disposition=f'attachment; filename="{model.id}.zip"',
-            )
+        self.ds_client.create_model_artifact(
+            model.id,
+            model_zip,
+            content_disposition=f'attachment; filename="{model.id}.zip"',
+        )
         return model.id
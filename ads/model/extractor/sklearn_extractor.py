@@ -5,9 +5,8 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 
+import functools
 import logging
-import re
-from collections import defaultdict
 
 from ads.model.extractor.model_info_extractor import (
     ModelInfoExtractor,
@@ -15,6 +14,17 @@ from ads.model.extractor.model_info_extractor import (
 )
 from ads.common.model_metadata import Framework
 
+# Translation table deleting the parentheses from the pipeline steps representation.
+_PARENTHESES_TABLE = str.maketrans("", "", "()")
+
+
+@functools.lru_cache(maxsize=1)
+def _sklearn_version():
+    """Returns the version of the installed sklearn, imported only once per process."""
+    import sklearn
+
+    return sklearn.__version__
+
 
 class SklearnExtractor(ModelInfoExtractor):
     """Class that extract model metadata from sklearn models.
@@ -72,9 +82,7 @@ class SklearnExtractor(ModelInfoExtractor):
         str:
            The framework version of the model.
         """
-        import sklearn
-
-        return sklearn.__version__
+        return _sklearn_version()
 
     @property
     def hyperparameter(self):
@@ -91,16 +99,20 @@ class SklearnExtractor(ModelInfoExtractor):
             new_dict = hp_dict.copy()
             # handle sklearn pipeline case
             if "steps" in hp_dict:
-                new_dict["steps"] = defaultdict(list)
-                for i, (k, v) in enumerate(hp_dict["steps"]):
-                    new_dict["steps"][i] = {k: re.sub("[()]", "", str(v))}
-                    new_dict[k] = re.sub("[()]", "", str(v))
+                steps = [
+                    (k, str(v).translate(_PARENTHESES_TABLE))
+                    for k, v in hp_dict["steps"]
+                ]
+                new_dict["steps"] = {i: {k: v} for i, (k, v) in enumerate(steps)}
+                new_dict.update(steps)
             # handle sklearn model selection case
             elif "param_grid" in hp_dict:
                 new_dict["estimator"] = str(hp_dict["estimator"])
-                new_dict["param_grid"] = defaultdict(list)
-                for k, v in hp_dict["param_grid"].items():
-                    new_dict["param_grid"][k] = v.tolist()
+                # the grid values are usually lists, only numpy arrays need converting
+                new_dict["param_grid"] = {
+                    k: v.tolist() if hasattr(v, "tolist") else list(v)
+                    for k, v in hp_dict["param_grid"].items()
+                }
                 new_dict.update(self.model.best_params_)
 
             return normalize_hyperparameter(new_dict)
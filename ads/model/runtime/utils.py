@@ -4,6 +4,7 @@
 # Copyright (c) 2022 Oracle and/or its affiliates.
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
+import copy
 import json
 import logging
 import os
@@ -16,6 +17,11 @@ from ads.common.utils import PAR_LINK
 from ads.common.object_storage_details import ObjectStorageDetails
 from cerberus import DocumentError, Validator
 
+try:
+    from yaml import CSafeLoader as loader
+except:
+    from yaml import SafeLoader as loader
+
 MODEL_PROVENANCE_SCHEMA_PATH = os.path.join(
     os.path.dirname(os.path.abspath(__file__)),
     "schemas",
@@ -85,15 +91,34 @@ class SchemaValidator:
         dict
             Schema validator.
         """
-        with open(self.schema_file_path, encoding="utf-8") as schema_file:
-            ext = os.path.splitext(self.schema_file_path)[-1].lower()
-            if ext in [".yaml", ".yml"]:
-                schema_validator = yaml.load(schema_file, yaml.FullLoader)
-            elif ext in [".json"]:
-                schema_validator = json.load(schema_file)
-            else:
-                raise NotImplementedError(f"{ext} format schema is not supported.")
-        return schema_validator
+        # the validation may modify the schema, the cached one is kept intact.
+        return copy.deepcopy(_load_schema(self.schema_file_path))
+
+
+@lru_cache(maxsize=None)
+def _load_schema(schema_file_path: str) -> Dict:
+    """Loads the schema file. The schema files ship with ADS,
+    so each of them is read and parsed only once per process.
+
+    Parameters
+    ----------
+    schema_file_path: (str)
+        The schema file path.
+
+    Returns
+    -------
+    Dict
+        The schema.
+    """
+    with open(schema_file_path, encoding="utf-8") as schema_file:
+        ext = os.path.splitext(schema_file_path)[-1].lower()
+        if ext in [".yaml", ".yml"]:
+            schema = yaml.load(schema_file, Loader=loader)
+        elif ext in [".json"]:
+            schema = json.load(schema_file)
+        else:
+            raise NotImplementedError(f"{ext} format schema is not supported.")
+    return schema
 
 
 @lru_cache(maxsize=1)
@@ -385,7 +385,10 @@ source {os.path.join(DEFAULT_IMAGE_CONDA_DIR, slug, 'bin/activate')}
                 image,
                 bind_volumes,
                 env_vars,
-                command=f"bash {os.path.join(DEFAULT_IMAGE_SCRIPT_DIR, 'entryscript.sh')}",
+                command=[
+                    "bash",
+                    os.path.join(DEFAULT_IMAGE_SCRIPT_DIR, "entryscript.sh"),
+                ],
             )
             # Bad Request ("OCI runtime create failed: container_linux.go:380:
             # starting container process caused: exec: "source": executable file not found in $PATH: unknown")
@@ -406,9 +406,9 @@ def _install(
                     image=ML_JOB_IMAGE,
                     bind_volumes=volumes,
                     env_vars={},
-                    command=os.path.join(
-                        DEFAULT_IMAGE_HOME_DIR, slug, "bin/conda-unpack"
-                    ),
+                    command=[
+                        os.path.join(DEFAULT_IMAGE_HOME_DIR, slug, "bin/conda-unpack")
+                    ],
                 )
             except Exception:
                 raise RuntimeError(f"Error unpacking environment {slug}.")
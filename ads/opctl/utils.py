@@ -5,21 +5,20 @@
 # Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
 
 
+import codecs
 import functools
+import locale
 import logging
 import os
-import subprocess
+import shutil
 import sys
 import tempfile
 import urllib.parse
-from distutils import dir_util
 from subprocess import Popen, PIPE, STDOUT
 from typing import Union, List, Tuple, Dict
 import shlex
-import yaml
 
 import ads
-from ads.common.oci_client import OCIClientFactory
 from ads.opctl import logger
 from ads.opctl.constants import (
     ML_JOB_IMAGE,
@@ -32,17 +31,36 @@ from ads.common.decorator.runtime_dependency import (
     OptionalDependency,
 )
 
+_CURR_DIR = os.path.dirname(os.path.abspath(__file__))
+_RUN_COMMAND_READ_SIZE = 1 << 16
+# The proxy settings passed to docker build as build arguments.
+_PROXY_ENV_VARS = ("no_proxy", "http_proxy", "https_proxy")
+
+
+@functools.lru_cache(maxsize=None)
+def _load_packaged_yaml(*path: str):
+    """Loads a YAML file shipped with the opctl package.
+
+    The files cannot change while the process is running, so each one is parsed once.
+    The returned object is shared between the callers and must not be modified.
+    """
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as loader
+    except:
+        from yaml import SafeLoader as loader
+
+    with open(os.path.join(_CURR_DIR, *path)) as f:
+        return yaml.load(f, Loader=loader)
+
 
 def get_service_pack_prefix() -> Dict:
-    curr_dir = os.path.dirname(os.path.abspath(__file__))
-    service_config_file = os.path.join(curr_dir, "conda", "config.yaml")
-    with open(service_config_file) as f:
-        service_config = yaml.safe_load(f.read())
-    if all(key in os.environ for key in ["CONDA_BUCKET_NS", "CONDA_BUCKET_NAME"]):
-        bucket_info = {
-            "name": os.environ["CONDA_BUCKET_NAME"],
-            "namespace": os.environ["CONDA_BUCKET_NS"],
-        }
+    service_config = _load_packaged_yaml("conda", "config.yaml")
+    bucket_namespace = os.environ.get("CONDA_BUCKET_NS")
+    bucket_name = os.environ.get("CONDA_BUCKET_NAME")
+    if bucket_namespace is not None and bucket_name is not None:
+        bucket_info = {"name": bucket_name, "namespace": bucket_namespace}
     else:
         bucket_info = service_config["bucket_info"].get(
             os.environ.get("NB_REGION", "default"),
@@ -60,16 +78,17 @@ def parse_conda_uri(uri: str) -> Tuple[str, str, str, str]:
     path = parsed.path
     if path.startswith("/"):
         path = path[1:]
-    bucket, ns = parsed.netloc.split("@")
+    bucket, sep, ns = parsed.netloc.partition("@")
+    if not sep or "@" in ns:
+        raise ValueError(
+            f"{uri} is not a valid conda pack uri, expected oci://<bucket>@<namespace>/<path>."
+        )
     slug = os.path.basename(path)
     return ns, bucket, path, slug
 
 
 def list_ads_operators() -> dict:
-    curr_dir = os.path.dirname(os.path.abspath(__file__))
-    with open(os.path.join(curr_dir, "index.yaml"), "r") as f:
-        ads_operators = yaml.safe_load(f.read())
-    return ads_operators or []
+    return _load_packaged_yaml("index.yaml") or []
 
 
 def get_oci_region(auth: dict) -> str:
@@ -79,18 +98,42 @@ def get_oci_region(auth: dict) -> str:
         return auth["signer"].region
 
 
+def _get_tenancy_id(auth: dict) -> str:
+    if len(auth["config"]) > 0:
+        return auth["config"].get("tenancy")
+    return getattr(auth["signer"], "tenancy_id", None)
+
+
+# The object storage namespace and the home region key of a tenancy do not change,
+# they are looked up once per tenancy.
+_NAMESPACE_CACHE = {}
+_REGION_KEY_CACHE = {}
+
+
 def get_namespace(auth: dict) -> str:
+    from ads.common.oci_client import OCIClientFactory
+
+    tenancy = _get_tenancy_id(auth)
+    if tenancy in _NAMESPACE_CACHE:
+        return _NAMESPACE_CACHE[tenancy]
     client = OCIClientFactory(**auth).object_storage
-    return client.get_namespace().data
+    namespace = client.get_namespace().data
+    if tenancy:
+        _NAMESPACE_CACHE[tenancy] = namespace
+    return namespace
 
 
 def get_region_key(auth: dict) -> str:
-    if len(auth["config"]) > 0:
-        tenancy = auth["config"]["tenancy"]
-    else:
-        tenancy = auth["signer"].tenancy_id
+    from ads.common.oci_client import OCIClientFactory
+
+    tenancy = _get_tenancy_id(auth)
+    if tenancy in _REGION_KEY_CACHE:
+        return _REGION_KEY_CACHE[tenancy]
     client = OCIClientFactory(**auth).identity
-    return client.get_tenancy(tenancy).data.home_region_key
+    region_key = client.get_tenancy(tenancy).data.home_region_key
+    if tenancy:
+        _REGION_KEY_CACHE[tenancy] = region_key
+    return region_key
 
 
 # Not needed at the moment
@@ -119,12 +162,11 @@ def publish_image(image: str, registry: str = None) -> None:  # pragma: no cover
         print(f"pushed {image}")
         return image
     else:
-        run_command(
-            ["docker", "tag", f"{image}", f"{registry}/{os.path.basename(image)}"]
-        )
-        run_command(["docker", "push", f"{registry}/{os.path.basename(image)}"])
-        print(f"pushed {registry}/{os.path.basename(image)}")
-        return f"{registry}/{os.path.basename(image)}"
+        registry_image = f"{registry}/{os.path.basename(image)}"
+        run_command(["docker", "tag", f"{image}", registry_image])
+        run_command(["docker", "push", registry_image])
+        print(f"pushed {registry_image}")
+        return registry_image
 
 
 def build_image(
@@ -150,7 +192,6 @@ def build_image(
     -------
     None
     """
-    curr_dir = os.path.dirname(os.path.abspath(__file__))
     if image_type == "ads-ops-custom":
         if not source_folder or not dst_image:
             raise ValueError(
@@ -165,31 +206,32 @@ def build_image(
             "-t",
             image,
             "-f",
-            os.path.join(curr_dir, "docker", dockerfile),
+            os.path.join(_CURR_DIR, "docker", dockerfile),
         ]
         if target:
-            command += ["--target", target]
-        if os.environ.get("no_proxy"):
-            command += ["--build-arg", f"no_proxy={os.environ['no_proxy']}"]
-        if os.environ.get("http_proxy"):
-            command += ["--build-arg", f"http_proxy={os.environ['http_proxy']}"]
-        if os.environ.get("https_proxy"):
-            command += ["--build-arg", f"https_proxy={os.environ['https_proxy']}"]
-        command += [os.path.abspath(curr_dir)]
+            command.extend(("--target", target))
+        for proxy in _PROXY_ENV_VARS:
+            value = os.environ.get(proxy)
+            if value:
+                command.extend(("--build-arg", f"{proxy}={value}"))
+        command.append(_CURR_DIR)
         logger.info(f"Build image with command {command}")
         proc = run_command(command)
     if proc.returncode != 0:
         raise RuntimeError(f"Docker build failed.")
 
 
+# The image name, dockerfile and build target for each (image type, gpu) pair.
+_IMAGE_DOCKERFILE_TARGETS = {
+    ("job-local", False): (ML_JOB_IMAGE, "Dockerfile.job", None),
+    ("job-local", True): (ML_JOB_GPU_IMAGE, "Dockerfile.job.gpu", None),
+    ("ads-ops-base", False): (OPS_IMAGE_BASE, "Dockerfile", "base"),
+    ("ads-ops-base", True): (OPS_IMAGE_GPU_BASE, "Dockerfile.gpu", "base"),
+}
+
+
 def _get_image_name_dockerfile_target(type: str, gpu: bool) -> str:
-    look_up = {
-        ("job-local", False): (ML_JOB_IMAGE, "Dockerfile.job", None),
-        ("job-local", True): (ML_JOB_GPU_IMAGE, "Dockerfile.job.gpu", None),
-        ("ads-ops-base", False): (OPS_IMAGE_BASE, "Dockerfile", "base"),
-        ("ads-ops-base", True): (OPS_IMAGE_GPU_BASE, "Dockerfile.gpu", "base"),
-    }
-    return look_up[(type, gpu)]
+    return _IMAGE_DOCKERFILE_TARGETS[(type, gpu)]
 
 
 @runtime_dependency(module="docker", install_from=OptionalDependency.OPCTL)
@@ -204,36 +246,42 @@ def _build_custom_operator_image(
     except docker.errors.ImageNotFound:
         build_image("ads-ops-base", gpu)
     with tempfile.TemporaryDirectory() as td:
-        dir_util.copy_tree(source_folder, os.path.join(td, operator))
+        shutil.copytree(source_folder, os.path.join(td, operator))
+        dockerfile = [f"FROM {base_image_name}"]
         if os.path.exists(os.path.join(td, operator, "environment.yaml")):
-            with open(os.path.join(td, "Dockerfile"), "w") as f:
-                f.write(
-                    f"""
-FROM {base_image_name}
-COPY ./{operator}/environment.yaml operators/{operator}/environment.yaml
-RUN conda env update -f operators/{operator}/environment.yaml --name op_env && conda clean -afy
-COPY ./{operator} operators/{operator}
-                        """
-                )
-        else:
-            with open(os.path.join(td, "Dockerfile"), "w") as f:
-                f.write(
-                    f"""
-FROM {base_image_name}
-COPY ./{operator} operators/{operator}
-                        """
-                )
+            dockerfile += [
+                f"COPY ./{operator}/environment.yaml operators/{operator}/environment.yaml",
+                f"RUN conda env update -f operators/{operator}/environment.yaml --name op_env && conda clean -afy",
+            ]
+        dockerfile.append(f"COPY ./{operator} operators/{operator}")
+        with open(os.path.join(td, "Dockerfile"), "w") as f:
+            f.write("\n".join(dockerfile) + "\n")
         return run_command(["docker", "build", "-t", f"{dst_image}", "."], td)
 
 
 def run_command(
     cmd: Union[str, List[str]], cwd: str = None, shell: bool = False
 ) -> Popen:
-    proc = Popen(
-        cmd, cwd=cwd, stdout=PIPE, stderr=STDOUT, universal_newlines=True, shell=shell
+    proc = Popen(cmd, cwd=cwd, stdout=PIPE, stderr=STDOUT, shell=shell)
+    read_chunk = functools.partial(
+        os.read, proc.stdout.fileno(), _RUN_COMMAND_READ_SIZE
     )
-    for x in iter(proc.stdout.readline, ""):
-        print(x, file=sys.stdout, end="")
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None:
+        # the output is forwarded as is, without decoding it line by line
+        sys.stdout.flush()
+        for chunk in iter(read_chunk, b""):
+            out.write(chunk)
+            out.flush()
+    else:
+        # sys.stdout only accepts text, e.g. in a notebook
+        decoder = codecs.getincrementaldecoder(locale.getpreferredencoding(False))(
+            errors="replace"
+        )
+        for chunk in iter(read_chunk, b""):
+            sys.stdout.write(decoder.decode(chunk))
+        sys.stdout.write(decoder.decode(b"", final=True))
+    proc.stdout.close()
     proc.wait()
     return proc
 
@@ -285,13 +333,12 @@ def suppress_traceback(debug: bool = True) -> None:
 
 @runtime_dependency(module="docker", install_from=OptionalDependency.OPCTL)
 def get_docker_client() -> "docker.client.DockerClient":
-    process = subprocess.Popen(
-        ["docker", "info"], stdout=subprocess.DEVNULL, stderr=subprocess.STDOUT
-    )
-    process.communicate()
-    if process.returncode != 0:
+    try:
+        client = docker.from_env()
+        client.ping()
+    except Exception:
         raise RuntimeError("Docker is not started.")
-    return docker.from_env()
+    return client
 
 
 class OCIAuthContext:
@@ -321,7 +368,7 @@ def run_container(
     image: str,
     bind_volumes: Dict,
     env_vars: Dict,
-    command: str = None,
+    command: Union[str, List[str]] = None,
     entrypoint: str = None,
     verbose: bool = False,
 ):
@@ -333,6 +380,8 @@ def run_container(
     logger.info(f"command: {command}")
     logger.info(f"entrypoint: {entrypoint}")
 
+    if isinstance(command, str):
+        command = shlex.split(command)
     client = get_docker_client()
     try:
         client.api.inspect_image(image)
@@ -342,7 +391,7 @@ def run_container(
     container = client.containers.run(
         image=image,
         volumes=bind_volumes,
-        command=shlex.split(command) if command else None,
+        command=command or None,
         environment=env_vars,
         detach=True,
         entrypoint=entrypoint,
@@ -351,8 +400,11 @@ def run_container(
     )
     logger.info(f"Container ID: {container.id}")
 
-    for line in container.logs(stream=True, follow=True):
-        logger.info(line.decode("utf-8").strip())
+    # the logs are only streamed when they would be shown,
+    # container.wait() below blocks until the container exits in both cases
+    if logger.isEnabledFor(logging.INFO):
+        for line in container.logs(stream=True, follow=True):
+            logger.info(line.decode("utf-8").strip())
 
     result = container.wait()
     container.remove()
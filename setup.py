@@ -20,6 +20,7 @@ install_requires = [
     "cloudpickle>=1.6.0",
     "fsspec>=0.8.7",
     "jinja2>=2.11.2",
+    "jsonschema>=3.0.0",
     "gitpython>=3.1.2",
     "matplotlib>=3.1.3",
     "numpy>=1.19.2",
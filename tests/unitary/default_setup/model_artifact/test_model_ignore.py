@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; -*-
+
+# Copyright (c) 2022 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+"""Unit tests for listing the model artifact files filtered by the .model-ignore file."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from ads.common.model_artifact import ModelArtifact, _iter_artifact_files
+from ads.common.utils import get_files
+
+ARTIFACT_FILES = [
+    "score.py",
+    "runtime.yaml",
+    "database.csv",
+    "data/x.csv",
+    "data/y/z.txt",
+    "sub/data/q",
+    "sub/keep.py",
+    "sub/__pycache__/keep.cpython-38.pyc",
+    "__pycache__/score.cpython-38.pyc",
+    "notes/a.txt",
+]
+
+
+class TestModelIgnore:
+    """Tests the artifact files listing against `ads.common.utils.get_files`."""
+
+    @pytest.fixture
+    def artifact_dir(self, tmp_path):
+        artifact_dir = os.path.join(tmp_path, "artifact")
+        for file_name in ARTIFACT_FILES:
+            file_path = os.path.join(artifact_dir, file_name)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            Path(file_path).write_text(file_name)
+        return artifact_dir
+
+    @pytest.mark.parametrize(
+        "ignore_patterns",
+        [
+            [],
+            ["data"],
+            ["__pycache__"],
+            ["data/"],
+            ["__pycache__/"],
+            ["*.pyc"],
+            ["data*"],
+            ["sub/data"],
+            ["notes/", "data"],
+            ["# data/", "", "  sub/  ", "*.py"],
+        ],
+    )
+    def test_same_as_original_listing(self, artifact_dir, ignore_patterns):
+        """Ensures the files are filtered the same way as `get_files` filters them."""
+        Path(os.path.join(artifact_dir, ".model-ignore")).write_text(
+            "\n".join(ignore_patterns)
+        )
+        expected = get_files(artifact_dir)
+        assert [
+            file_name for file_name, _ in _iter_artifact_files(artifact_dir)
+        ] == expected
+        assert ModelArtifact(artifact_dir, reload=False)._get_files() == expected
+
+    def test_pattern_without_slash_keeps_folder_content(self, artifact_dir):
+        """Ensures a pattern without the trailing slash only ignores the matching paths."""
+        Path(os.path.join(artifact_dir, ".model-ignore")).write_text("data\n")
+        files = [file_name for file_name, _ in _iter_artifact_files(artifact_dir)]
+        assert "data" not in files
+        assert os.path.join("sub", "data") not in files
+        assert os.path.join("data", "x.csv") in files
+        assert os.path.join("data", "y", "z.txt") in files
+        assert os.path.join("sub", "data", "q") in files
+
+    def test_pattern_with_slash_ignores_folder_content(self, artifact_dir):
+        """Ensures a pattern with the trailing slash ignores the folder and its content."""
+        Path(os.path.join(artifact_dir, ".model-ignore")).write_text("data/\n")
+        files = [file_name for file_name, _ in _iter_artifact_files(artifact_dir)]
+        assert not [file_name for file_name in files if "data" in file_name]
+        assert os.path.join("sub", "keep.py") in files
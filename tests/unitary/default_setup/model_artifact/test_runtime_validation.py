@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; -*-
+
+# Copyright (c) 2022 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+"""Unit tests for validating the runtime.yaml content when the model artifact is saved."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from python_jsonschema_objects.validators import ValidationError
+
+from ads.common.model_artifact import (
+    ModelArtifact,
+    _emit_runtime_yaml,
+    _get_runtime_ns,
+)
+
+
+class TestRuntimeValidation:
+    """Tests the validation of the runtime.yaml content in save()."""
+
+    @pytest.fixture
+    def artifact_dir(self, tmp_path):
+        return str(tmp_path)
+
+    def _save(self, artifact_dir, content):
+        with open(
+            os.path.join(artifact_dir, "runtime.yaml"), "w", encoding="utf-8"
+        ) as stream:
+            _emit_runtime_yaml(content, stream)
+        ModelArtifact(artifact_dir, reload=False).save(
+            project_id="ocid1.datascienceproject.oc1.iad.<unique_ocid>",
+            compartment_id="ocid1.compartment.oc1..<unique_ocid>",
+            auth={"config": {}},
+            ignore_pending_changes=True,
+        )
+
+    @pytest.mark.parametrize(
+        "content",
+        [
+            {"MODEL_ARTIFACT_VERSION": 3.0},
+            {
+                "MODEL_DEPLOYMENT": {
+                    "INFERENCE_CONDA_ENV": {"INFERENCE_ENV_TYPE": "unknown"}
+                }
+            },
+        ],
+    )
+    @patch("ads.catalog.model.ModelCatalog")
+    def test_invalid_runtime_not_saved(self, mock_model_catalog, artifact_dir, content):
+        """Ensures an invalid runtime.yaml is neither rewritten nor uploaded."""
+        with pytest.raises(ValidationError):
+            self._save(artifact_dir, content)
+        mock_model_catalog.assert_not_called()
+
+    @patch("ads.catalog.model.ModelCatalog")
+    def test_runtime_validated(self, mock_model_catalog, artifact_dir):
+        """Ensures the whole runtime object is validated once it is built."""
+        with patch.object(
+            _get_runtime_ns().ModelArtifactSchema,
+            "validate",
+            side_effect=ValidationError("invalid runtime"),
+        ) as mock_validate:
+            with pytest.raises(ValidationError, match="invalid runtime"):
+                self._save(artifact_dir, {"MODEL_ARTIFACT_VERSION": "3.0"})
+        mock_validate.assert_called_once()
+        mock_model_catalog.assert_not_called()
+
+    @patch("ads.catalog.model.ModelCatalog")
+    def test_valid_runtime_saved(self, mock_model_catalog, artifact_dir):
+        """Ensures a valid runtime.yaml is saved."""
+        self._save(
+            artifact_dir,
+            {
+                "MODEL_ARTIFACT_VERSION": "3.0",
+                "MODEL_DEPLOYMENT": {
+                    "INFERENCE_CONDA_ENV": {"INFERENCE_ENV_TYPE": "published"}
+                },
+            },
+        )
+        mock_model_catalog.return_value.upload_model.assert_called_once()
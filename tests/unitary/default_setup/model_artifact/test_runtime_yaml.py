@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# -*- coding: utf-8; -*-
+
+# Copyright (c) 2022 Oracle and/or its affiliates.
+# Licensed under the Universal Permissive License v 1.0 as shown at https://oss.oracle.com/licenses/upl/
+
+"""Unit tests for writing and reading the runtime.yaml of the model artifact."""
+
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from ads.common.model_artifact import (
+    ModelArtifact,
+    _emit_runtime_yaml,
+    _read_runtime_yaml,
+)
+
+_LOADERS = [yaml.SafeLoader]
+if yaml.__with_libyaml__:
+    _LOADERS.append(yaml.CSafeLoader)
+
+
+class TestRuntimeYaml:
+    """Tests the round trip of the runtime.yaml content."""
+
+    content = {
+        "MODEL_ARTIFACT_VERSION": "3.0",
+        "MODEL_DEPLOYMENT": {
+            "INFERENCE_CONDA_ENV": {
+                "INFERENCE_ENV_PATH": "oci://bucket@namespace/conda/env.tar.gz",
+                "INFERENCE_ENV_SLUG": "",
+                "INFERENCE_ENV_TYPE": "published",
+                "INFERENCE_PYTHON_VERSION": "3.8",
+            }
+        },
+        "MODEL_PROVENANCE": {
+            "TRAINING_CODE": {
+                "ARTIFACT_DIRECTORY": "/home/u/模型/😀",
+                "TRAINING_SCRIPT": "/home/u/模型/😀/score.py",
+                "GIT_BRANCH": 'quote " back\\slash',
+                "GIT_COMMIT": "tab\tnew\nline del\x7f c1\x80",
+            },
+            "TRAINING_CONDA_ENV": {},
+        },
+    }
+
+    @pytest.mark.parametrize("loader", _LOADERS)
+    def test_emit_round_trip(self, loader):
+        """Ensures the emitted content is loaded back unchanged."""
+        stream = io.StringIO()
+        _emit_runtime_yaml(self.content, stream)
+        assert yaml.load(stream.getvalue(), Loader=loader) == self.content
+
+    @pytest.mark.parametrize("loader", _LOADERS)
+    def test_emit_same_as_dumper(self, loader):
+        """Ensures the emitted content is loaded the same as the YAML dumper output."""
+        stream = io.StringIO()
+        _emit_runtime_yaml(self.content, stream)
+        assert yaml.load(stream.getvalue(), Loader=loader) == yaml.load(
+            yaml.dump(self.content, Dumper=yaml.SafeDumper), Loader=loader
+        )
+
+    def test_non_bmp_character_not_escaped(self):
+        """Ensures the characters outside of the BMP are not written as surrogate pairs."""
+        stream = io.StringIO()
+        _emit_runtime_yaml(self.content, stream)
+        assert "\\ud83d" not in stream.getvalue()
+        assert "😀" in stream.getvalue()
+
+    def test_read_runtime_yaml(self, tmp_path):
+        """Ensures the runtime.yaml written to the disk is read back unchanged."""
+        runtime_file = os.path.join(tmp_path, "runtime.yaml")
+        with open(runtime_file, "w", encoding="utf-8") as stream:
+            _emit_runtime_yaml(self.content, stream)
+        assert _read_runtime_yaml(runtime_file) == self.content
+
+    @pytest.mark.parametrize("loader", _LOADERS)
+    @patch("ads.catalog.model.ModelCatalog")
+    def test_save_round_trip(self, mock_model_catalog, loader, tmp_path):
+        """Ensures the runtime.yaml rewritten by save() is read back unchanged."""
+        artifact_dir = os.path.join(tmp_path, "模型", "😀")
+        os.makedirs(artifact_dir)
+        runtime_file = os.path.join(artifact_dir, "runtime.yaml")
+        with open(runtime_file, "w", encoding="utf-8") as stream:
+            _emit_runtime_yaml(self.content, stream)
+
+        ModelArtifact(artifact_dir, reload=False).save(
+            project_id="ocid1.datascienceproject.oc1.iad.<unique_ocid>",
+            compartment_id="ocid1.compartment.oc1..<unique_ocid>",
+            auth={"config": {}},
+            ignore_pending_changes=True,
+        )
+        mock_model_catalog.return_value.upload_model.assert_called_once()
+
+        with open(runtime_file, encoding="utf-8") as stream:
+            runtime = yaml.load(stream, Loader=loader)
+        training_code = runtime["MODEL_PROVENANCE"]["TRAINING_CODE"]
+        assert training_code["ARTIFACT_DIRECTORY"] == artifact_dir
+        assert runtime["MODEL_DEPLOYMENT"] == self.content["MODEL_DEPLOYMENT"]
+        assert _read_runtime_yaml(runtime_file) == runtime
+
+    def test_read_runtime_yaml_rewritten_within_same_mtime(self, tmp_path):
+        """Ensures a runtime.yaml rewritten within the same timestamp is parsed again."""
+        runtime_file = os.path.join(tmp_path, "runtime.yaml")
+        with open(runtime_file, "w", encoding="utf-8") as stream:
+            _emit_runtime_yaml({"MODEL_ARTIFACT_VERSION": "1.0"}, stream)
+        mtime_ns = os.stat(runtime_file).st_mtime_ns
+        assert _read_runtime_yaml(runtime_file) == {"MODEL_ARTIFACT_VERSION": "1.0"}
+
+        with open(runtime_file, "w", encoding="utf-8") as stream:
+            _emit_runtime_yaml(self.content, stream)
+        os.utime(runtime_file, ns=(mtime_ns, mtime_ns))
+        assert _read_runtime_yaml(runtime_file) == self.content